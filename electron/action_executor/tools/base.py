@@ -362,6 +362,8 @@ class ToolInstanceRegistry:
 
 # Global instance registry
 _client_tool_registry = ToolInstanceRegistry()
+# Bound once: the registry mutates this dict in place, never replaces it
+_client_tool_instances = _client_tool_registry.tool_instances
 
 
 def get_client_tool_registry() -> ToolInstanceRegistry:
@@ -375,4 +377,4 @@ def get_client_tool(tool_name: str) -> Optional[BaseTool]:
     
     This is FAST! Just dict lookup!
     """
-    return _client_tool_registry.get(tool_name)
+    return _client_tool_instances.get(tool_name)
@@ -5,15 +5,31 @@ File System Operations Tools for Client
 Real file system tools that execute on the client machine.
 """
 
+import asyncio
 import os
 import subprocess
 import sys
+from abc import abstractmethod
+from collections import deque
 from typing import Dict, Any
 from datetime import datetime
 
 from ..base import BaseTool, ToolOutput
 
 
+# Home resolved once so "~" paths don't re-read the environment per call
+_HOME = os.path.expanduser("~")
+
+
+def _expand_path(path: str) -> str:
+    """Absolute path with a leading ``~``/``~/`` expanded against the cached home."""
+    if path.startswith("~") and (len(path) == 1 or path[1] in ("/", os.sep)):
+        path = _HOME + path[1:]
+    else:
+        path = os.path.expanduser(path)  # no-op unless ~otheruser
+    return os.path.abspath(path)
+
+
 def _is_special_target(path: str) -> bool:
     lowered = str(path or "").strip().lower()
     return lowered.startswith("shell:") or lowered.startswith("ms-settings:") or lowered.startswith("::{")
@@ -27,7 +43,7 @@ def _resolve_open_target(path: str) -> tuple[str, str | None]:
     if _is_special_target(candidate):
         return candidate, None
 
-    resolved = os.path.abspath(os.path.expanduser(candidate))
+    resolved = _expand_path(candidate)
     if not os.path.exists(resolved):
         return "", f"Path not found: {path}"
     return resolved, None
@@ -42,13 +58,30 @@ def _shell_open_path(path: str) -> None:
         subprocess.Popen(["xdg-open", path])
 
 
-class CreateFileTool(BaseTool):
+class _BlockingFsTool(BaseTool):
+    """
+    Base for tools whose body is blocking filesystem I/O.
+    
+    Subclasses implement sync ``_execute_blocking``; it runs in a worker
+    thread so large reads/writes/copies never stall the event loop.
+    """
+    
+    async def _execute(self, inputs: Dict[str, Any]) -> ToolOutput:
+        return await asyncio.to_thread(self._execute_blocking, inputs)
+    
+    @abstractmethod
+    def _execute_blocking(self, inputs: Dict[str, Any]) -> ToolOutput:
+        """Run the tool synchronously (called in a worker thread)."""
+        pass
+
+
+class CreateFileTool(_BlockingFsTool):
     """Create file tool."""
     
     def get_tool_name(self) -> str:
         return "file_create"
     
-    async def _execute(self, inputs: Dict[str, Any]) -> ToolOutput:
+    def _execute_blocking(self, inputs: Dict[str, Any]) -> ToolOutput:
         """Create a file with content."""
         path = inputs.get("path", "")
         content = inputs.get("content", "")
@@ -58,9 +91,9 @@ class CreateFileTool(BaseTool):
             return ToolOutput(success=False, data={}, error="Path is required")
         
         try:
-            expanded_path = os.path.expanduser(path)
+            expanded_path = _expand_path(path)
             
-            if os.path.exists(expanded_path) and not overwrite:
+            if not overwrite and os.path.exists(expanded_path):
                 return ToolOutput(
                     success=False, data={},
                     error=f"File already exists: {path}"
@@ -72,8 +105,8 @@ class CreateFileTool(BaseTool):
             
             with open(expanded_path, 'w', encoding='utf-8') as f:
                 f.write(content)
-            
-            file_stat = os.stat(expanded_path)
+                f.flush()
+                file_stat = os.fstat(f.fileno())
             
             self.logger.info(f"Created file: {path} ({file_stat.st_size} bytes)")
             
@@ -93,13 +126,13 @@ class CreateFileTool(BaseTool):
             return ToolOutput(success=False, data={}, error=str(e))
 
 
-class FolderCreateTool(BaseTool):
+class FolderCreateTool(_BlockingFsTool):
     """Create folder tool."""
     
     def get_tool_name(self) -> str:
         return "folder_create"
     
-    async def _execute(self, inputs: Dict[str, Any]) -> ToolOutput:
+    def _execute_blocking(self, inputs: Dict[str, Any]) -> ToolOutput:
         """Create a folder/directory."""
         path = inputs.get("path", "")
         recursive = inputs.get("recursive", True)
@@ -108,7 +141,7 @@ class FolderCreateTool(BaseTool):
             return ToolOutput(success=False, data={}, error="Path is required")
         
         try:
-            expanded_path = os.path.expanduser(path)
+            expanded_path = _expand_path(path)
             
             if recursive:
                 os.makedirs(expanded_path, exist_ok=True)
@@ -123,7 +156,8 @@ class FolderCreateTool(BaseTool):
                     "folder_path": path,
                     "absolute_path": expanded_path,
                     "created_at": datetime.now().isoformat(),
-                    "exists": os.path.exists(expanded_path)
+                    # makedirs/mkdir either created it or raised
+                    "exists": True
                 }
             )
             
@@ -132,13 +166,13 @@ class FolderCreateTool(BaseTool):
             return ToolOutput(success=False, data={}, error=str(e))
 
 
-class FileCopyTool(BaseTool):
+class FileCopyTool(_BlockingFsTool):
     """Copy file tool."""
     
     def get_tool_name(self) -> str:
         return "file_copy"
     
-    async def _execute(self, inputs: Dict[str, Any]) -> ToolOutput:
+    def _execute_blocking(self, inputs: Dict[str, Any]) -> ToolOutput:
         """Copy a file."""
         source = inputs.get("source", "")
         destination = inputs.get("destination", "")
@@ -153,16 +187,19 @@ class FileCopyTool(BaseTool):
         try:
             import shutil
             
-            source_path = os.path.expanduser(source)
-            dest_path = os.path.expanduser(destination)
+            source_path = _expand_path(source)
+            dest_path = _expand_path(destination)
             
-            if not os.path.exists(source_path):
+            # One stat for existence + size (the copy has the source's size)
+            try:
+                file_stat = os.stat(source_path)
+            except FileNotFoundError:
                 return ToolOutput(
                     success=False, data={},
                     error=f"Source file not found: {source}"
                 )
             
-            if os.path.exists(dest_path) and not overwrite:
+            if not overwrite and os.path.exists(dest_path):
                 return ToolOutput(
                     success=False, data={},
                     error=f"Destination already exists: {destination}"
@@ -174,8 +211,6 @@ class FileCopyTool(BaseTool):
             
             shutil.copy2(source_path, dest_path)
             
-            file_stat = os.stat(dest_path)
-            
             self.logger.info(f"Copied: {source} → {destination}")
             
             return ToolOutput(
@@ -193,13 +228,13 @@ class FileCopyTool(BaseTool):
             return ToolOutput(success=False, data={}, error=str(e))
 
 
-class FileSearchTool(BaseTool):
+class FileSearchTool(_BlockingFsTool):
     """File search tool."""
     
     def get_tool_name(self) -> str:
         return "file_search"
     
-    async def _execute(self, inputs: Dict[str, Any]) -> ToolOutput:
+    def _execute_blocking(self, inputs: Dict[str, Any]) -> ToolOutput:
         """Search for files."""
         query = inputs.get("query", "")
         search_path = inputs.get("path", ".")
@@ -209,7 +244,7 @@ class FileSearchTool(BaseTool):
             return ToolOutput(success=False, data={}, error="Query is required")
         
         try:
-            expanded_path = os.path.expanduser(search_path)
+            expanded_path = _expand_path(search_path)
             
             if not os.path.exists(expanded_path):
                 return ToolOutput(
@@ -222,24 +257,37 @@ class FileSearchTool(BaseTool):
             results = []
             query_lower = query.lower()
             
-            for root, dirs, files in os.walk(expanded_path):
-                for file in files:
-                    if query_lower in file.lower():
-                        full_path = os.path.join(root, file)
-                        file_stat = os.stat(full_path)
+            # scandir BFS: each DirEntry carries name/type from the directory
+            # read, so only matches cost a stat, and listing stops at max_results
+            pending = deque([expanded_path])
+            while pending and len(results) < max_results:
+                try:
+                    entries = os.scandir(pending.popleft())
+                except OSError:
+                    continue  # unreadable directory — skipped, as os.walk did
+                with entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                # Symlinked dirs are not descended into (os.walk default)
+                                if not entry.is_symlink():
+                                    pending.append(entry.path)
+                                continue
+                            if query_lower not in entry.name.lower():
+                                continue
+                            file_stat = entry.stat()
+                        except OSError:
+                            continue
                         
                         results.append({
-                            "filename": file,
-                            "path": full_path,
+                            "filename": entry.name,
+                            "path": entry.path,
                             "size_bytes": file_stat.st_size,
                             "modified_at": datetime.fromtimestamp(file_stat.st_mtime).isoformat()
                         })
                         
                         if len(results) >= max_results:
                             break
-                
-                if len(results) >= max_results:
-                    break
             
             self.logger.info(f"Found {len(results)} files")
             
@@ -259,13 +307,13 @@ class FileSearchTool(BaseTool):
             return ToolOutput(success=False, data={}, error=str(e))
 
 
-class FileReadTool(BaseTool):
+class FileReadTool(_BlockingFsTool):
     """Read file tool."""
     
     def get_tool_name(self) -> str:
         return "file_read"
     
-    async def _execute(self, inputs: Dict[str, Any]) -> ToolOutput:
+    def _execute_blocking(self, inputs: Dict[str, Any]) -> ToolOutput:
         """Read a file."""
         path = inputs.get("path", "")
         
@@ -273,7 +321,7 @@ class FileReadTool(BaseTool):
             return ToolOutput(success=False, data={}, error="Path is required")
         
         try:
-            expanded_path = os.path.expanduser(path)
+            expanded_path = _expand_path(path)
             
             if not os.path.exists(expanded_path):
                 return ToolOutput(
@@ -10,7 +10,7 @@ import logging
 from pathlib import Path
 from typing import Dict, Any, Optional
 
-from .base import get_client_tool_registry, BaseTool
+from .base import _client_tool_instances, get_client_tool_registry, BaseTool
 
 # Import all client tool classes
 from .file_system.operations import (
@@ -155,5 +155,4 @@ def get_client_tool_for_execution(tool_name: str) -> Optional[BaseTool]:
     
     This is called during task execution (FAST!).
     """
-    from .base import get_client_tool
-    return get_client_tool(tool_name)
+    return _client_tool_instances.get(tool_name)
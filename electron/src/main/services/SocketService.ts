@@ -8,6 +8,11 @@ type SocketEventForwardPayload = IEventPayloadMapping["socketEventForward"];
 type MicControlPayload = IEventPayloadMapping["onMicControl"];
 
 const MIC_CONTROL_EVENT = "device:mic-control";
+// Server coalesces small per-sid emits into one frame: [[event, data], ...]
+const BATCH_EVENT = "_batch";
+// Server sends task batches as a binary JSON attachment plus a small envelope
+const TASK_BATCH_EVENT = "task:execute_batch";
+const TASK_EXECUTE_EVENT = "task:execute";
 
 class SocketService {
   private socket: Socket | null = null;
@@ -153,17 +158,12 @@ class SocketService {
     socket.onAny((eventName, ...args) => {
       const data = args.length <= 1 ? args[0] : args;
 
-      if (eventName === MIC_CONTROL_EVENT) {
-        this.handleMicControlEvent(data);
+      if (eventName === BATCH_EVENT) {
+        this.handleBatchEvent(data);
         return;
       }
 
-      if (eventName === "spark:control") {
-        this.handleSparkControlEvent(data);
-        return;
-      }
-
-      this.broadcastSocketEvent({ event: eventName, data });
+      this.dispatchSocketEvent(eventName, data);
     });
 
     socket.io.on("reconnect_attempt", async () => {
@@ -184,6 +184,73 @@ class SocketService {
     });
   }
 
+  private dispatchSocketEvent(eventName: string, data: unknown): void {
+    if (eventName === MIC_CONTROL_EVENT) {
+      this.handleMicControlEvent(data);
+      return;
+    }
+
+    if (eventName === "spark:control") {
+      this.handleSparkControlEvent(data);
+      return;
+    }
+
+    if (eventName === TASK_BATCH_EVENT || eventName === TASK_EXECUTE_EVENT) {
+      this.broadcastSocketEvent({ event: eventName, data: this.decodeTaskBatchPayload(data) });
+      return;
+    }
+
+    this.broadcastSocketEvent({ event: eventName, data });
+  }
+
+  private decodeTaskBatchPayload(data: unknown): unknown {
+    if (!data || typeof data !== "object") {
+      return data;
+    }
+
+    const payload = data as Record<string, unknown>;
+    const rawTasks = payload.tasks;
+    if (!(rawTasks instanceof ArrayBuffer) && !ArrayBuffer.isView(rawTasks)) {
+      return data;
+    }
+
+    try {
+      // Server sends tasks column-wise (one array per TaskRecord field) on
+      // both task events; rebuild one record per index so renderer handlers
+      // see plain rows. server_completed_dependencies is absent when empty.
+      const columns = JSON.parse(new TextDecoder().decode(rawTasks)) as Record<string, unknown[]>;
+      const names = Object.keys(columns);
+      const count = columns.task?.length ?? 0;
+      const tasks: Array<Record<string, unknown>> = [];
+      for (let i = 0; i < count; i++) {
+        const task: Record<string, unknown> = {};
+        for (const name of names) {
+          task[name] = columns[name][i];
+        }
+        tasks.push(task);
+      }
+
+      return { ...payload, tasks };
+    } catch (error) {
+      console.error("❌ [SocketService] Failed to decode task batch payload:", error);
+      return data;
+    }
+  }
+
+  private handleBatchEvent(data: unknown): void {
+    if (!Array.isArray(data)) {
+      console.warn("⚠️ [SocketService] Ignoring invalid batch payload:", data);
+      return;
+    }
+
+    for (const entry of data) {
+      if (!Array.isArray(entry) || typeof entry[0] !== "string") {
+        continue;
+      }
+      this.dispatchSocketEvent(entry[0], entry[1]);
+    }
+  }
+
   private async getAccessToken(): Promise<string | null> {
     const { getToken } = await import("./TokenManager.js");
     return getToken("access_token");
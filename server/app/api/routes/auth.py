@@ -1,7 +1,7 @@
 from fastapi.encoders import jsonable_encoder
 from typing import Any, Dict
 from fastapi import APIRouter, Body,Depends,  Query,Request
-from app.cache import get_user_details, set_user_details, update_user_details
+from app.cache import get_user_details, set_user_details, update_user_details, invalidate_user_cache
 from app.db.mongo import get_db
 from app.utils.serialize_mongo_doc import serialize_doc
 from app.models.user_model import UserModel , UserResponse, UserUpdateQuery
@@ -388,6 +388,11 @@ async def update_user_details_endpoint(
     if not updated_user:
         return send_error("User not found", 404)
 
+    # Preferences changed — drop cached copies (user cache tiers + TTS voice prefs)
+    from app.socket.tts_handler import invalidate_tts_prefs
+    await invalidate_user_cache(user_id)
+    invalidate_tts_prefs(user_id)
+
     # Sync any API keys to Windows Registry + in-memory cache
     from app.ai.providers.key_manager import register_api_key_unified, _KeyCache, PROVIDER_ENV_MAP
 
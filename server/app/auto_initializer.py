@@ -15,7 +15,7 @@ Usage
         from app.services.tts_services import tts_service
         await tts_service.warmup_tts_engine()
 
-    register("tts", _warmup_tts)
+    register("tts", _warmup_tts, concurrent=True)  # independent → may overlap
 
 **Run all at startup (in main.py):**
 
@@ -33,26 +33,53 @@ from typing import Awaitable, Callable, Union
 
 logger = logging.getLogger(__name__)
 
-# (name, callable) — order matters
-_registry: list[tuple[str, Callable[[], Union[None, Awaitable[None]]]]] = []
+# (name, callable, concurrent) — order matters
+_registry: list[tuple[str, Callable[[], Union[None, Awaitable[None]]], bool]] = []
 
 
 def register(
     name: str,
     fn: Callable[[], Union[None, Awaitable[None]]],
+    *,
+    concurrent: bool = False,
 ) -> None:
     """
     Register an initializer.
 
     Args:
-        name: Human-readable label for log output.
-        fn:   Sync or async callable (no arguments).
+        name:       Human-readable label for log output.
+        fn:         Sync or async callable (no arguments).
+        concurrent: Independent of other initializers. Consecutive
+                    concurrent initializers run together (sync ones in a
+                    worker thread); the next non-concurrent one waits for
+                    all of them.
     """
-    _registry.append((name, fn))
+    _registry.append((name, fn, concurrent))
+
+
+async def _run_one(name: str, fn: Callable[[], Union[None, Awaitable[None]]], threaded: bool) -> None:
+    t0 = time.time()
+    try:
+        if threaded and not asyncio.iscoroutinefunction(fn):
+            result = await asyncio.to_thread(fn)
+        else:
+            result = fn()
+        if asyncio.iscoroutine(result):
+            await result
+        elapsed = time.time() - t0
+        logger.info(f"  ✅ {name} ({elapsed:.2f}s)")
+    except Exception as e:
+        elapsed = time.time() - t0
+        logger.error(f"  ❌ {name} failed ({elapsed:.2f}s): {e}")
+        # Don't raise — allow other initializers to still run.
 
 
 async def run_all() -> None:
-    """Execute every registered initializer sequentially, logging timing."""
+    """Execute every registered initializer in order, logging timing.
+
+    Runs of consecutive ``concurrent`` initializers are awaited together,
+    so their wall time is the slowest one rather than the sum.
+    """
     if not _registry:
         logger.info("ℹ️  AutoInitializer: nothing registered")
         return
@@ -61,18 +88,17 @@ async def run_all() -> None:
     logger.info(f"🚀 AutoInitializer: running {len(_registry)} initializer(s)...")
     logger.info("=" * 60)
 
-    for name, fn in _registry:
-        t0 = time.time()
-        try:
-            result = fn()
-            if asyncio.iscoroutine(result):
-                await result
-            elapsed = time.time() - t0
-            logger.info(f"  ✅ {name} ({elapsed:.2f}s)")
-        except Exception as e:
-            elapsed = time.time() - t0
-            logger.error(f"  ❌ {name} failed ({elapsed:.2f}s): {e}")
-            # Don't raise — allow other initializers to still run.
+    group: list[tuple[str, Callable[[], Union[None, Awaitable[None]]]]] = []
+    for name, fn, concurrent in _registry:
+        if concurrent:
+            group.append((name, fn))
+            continue
+        if group:
+            await asyncio.gather(*(_run_one(n, f, threaded=True) for n, f in group))
+            group = []
+        await _run_one(name, fn, threaded=False)
+    if group:
+        await asyncio.gather(*(_run_one(n, f, threaded=True) for n, f in group))
 
     logger.info("=" * 60)
     logger.info("✅ AutoInitializer: all done")
@@ -5,6 +5,7 @@ from app.kernel.execution.execution_models import (
     LifecycleMessages,
     Task,
     TaskBatch,
+    TaskBatchWire,
     TaskControl,
     TaskOutput,
     TaskRecord,
@@ -29,6 +30,7 @@ __all__ = [
     "LifecycleMessages",
     "Task",
     "TaskBatch",
+    "TaskBatchWire",
     "TaskControl",
     "TaskOutput",
     "TaskRecord",
@@ -734,12 +734,13 @@ class ExecutionEngine:
                 
                 await self.orchestrator.mark_task_emitted(user_id, task.task_id)
                 
-                success = await self.socket_handler.emit_task_single(user_id, task)
+                # Coalesced with other ready tasks into one batch frame
+                success = await self.socket_handler.push_task(user_id, task)
                 
                 if success:
-                    logger.info(f"  Emitted: {task.task_id} ({task.tool})")
+                    logger.info(f"  Queued: {task.task_id} ({task.tool})")
                 else:
-                    logger.warning(f"   Failed to emit: {task.task_id}")
+                    logger.warning(f"   Failed to queue: {task.task_id}")
             
             except Exception as e:
                 logger.error(f"  Error emitting {task.task_id}: {e}")
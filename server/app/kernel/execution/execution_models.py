@@ -4,9 +4,9 @@ TaskRecord stores the full Task for complete context.
 """
 
 import uuid
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Set
 from datetime import datetime
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from app.models import CamelModel
 
@@ -142,8 +142,17 @@ class ExecutionState(CamelModel):
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
 
+    # Maintained on status transitions so dependency checks are set lookups
+    _completed_ids: Set[str] = PrivateAttr(default_factory=set)
+
+    @property
+    def completed_task_ids(self) -> Set[str]:
+        """Live set of completed task ids (do not mutate)."""
+        return self._completed_ids
+
     def add_task(self, record: TaskRecord):
         self.tasks[record.task_id] = record
+        self._track_completion(record.task_id, record.status)
         self.updated_at = datetime.now()
 
     def get_task(self, task_id: str) -> Optional[TaskRecord]:
@@ -157,17 +166,20 @@ class ExecutionState(CamelModel):
         task = self.tasks.get(task_id)
         if task:
             task.status = status
+            self._track_completion(task_id, status)
             self.updated_at = datetime.now()
 
+    def _track_completion(self, task_id: str, status: TaskStatus) -> None:
+        if status == "completed":
+            self._completed_ids.add(task_id)
+        else:
+            self._completed_ids.discard(task_id)
+
     def get_tasks_by_status(self, status: TaskStatus) -> List[TaskRecord]:
         return [task for task in self.tasks.values() if task.status == status]
 
     def get_completed_task_ids(self) -> List[str]:
-        return [
-            task_id
-            for task_id, task in self.tasks.items()
-            if task.status == "completed"
-        ]
+        return [task_id for task_id in self.tasks if task_id in self._completed_ids]
 
 
 class TaskBatch(CamelModel):
@@ -176,6 +188,52 @@ class TaskBatch(CamelModel):
     client_tasks: List[TaskRecord] = Field(default_factory=list)
 
 
+class TaskBatchWire(CamelModel):
+    """
+    Column-oriented (SoA) wire form of a client task batch.
+
+    Every field is a column with one entry per task, in batch order. Column
+    names match TaskRecord fields so the client rebuilds row i by reading
+    index i of each column.
+    """
+    task: List[Task] = Field(default_factory=list)
+    status: List[TaskStatus] = Field(default_factory=list)
+    resolved_inputs: List[Dict[str, Any]] = Field(default_factory=list)
+    output: List[Optional[TaskOutput]] = Field(default_factory=list)
+    error: List[Optional[str]] = Field(default_factory=list)
+    created_at: List[datetime] = Field(default_factory=list)
+    started_at: List[Optional[datetime]] = Field(default_factory=list)
+    completed_at: List[Optional[datetime]] = Field(default_factory=list)
+    duration_ms: List[Optional[int]] = Field(default_factory=list)
+    emitted_at: List[Optional[datetime]] = Field(default_factory=list)
+    ack_received_at: List[Optional[datetime]] = Field(default_factory=list)
+    approval_state: List[Optional[ApprovalState]] = Field(default_factory=list)
+    approval_request_id: List[Optional[str]] = Field(default_factory=list)
+
+    # Dependencies already completed server-side, per task. Left empty when
+    # no task has any, so the sender can drop the column from the wire.
+    server_completed_dependencies: List[List[str]] = Field(default_factory=list)
+
+    @classmethod
+    def from_records(
+        cls,
+        records: List[TaskRecord],
+        server_completed: Optional[Dict[str, List[str]]] = None,
+    ) -> "TaskBatchWire":
+        """Build all columns in one pass over already-validated records."""
+        columns: Dict[str, List[Any]] = {name: [] for name in TaskRecord.model_fields}
+        for record in records:
+            for name, column in columns.items():
+                column.append(getattr(record, name))
+
+        if server_completed:
+            columns["server_completed_dependencies"] = [
+                server_completed.get(record.task_id, []) for record in records
+            ]
+        # Records are already validated — skip re-validating every cell
+        return cls.model_construct(**columns)
+
+
 class SQHResponse(CamelModel):
     """
     Response from SQH LLM
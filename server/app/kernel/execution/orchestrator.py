@@ -10,7 +10,7 @@ Production-Grade Task Orchestrator
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime
 
 from app.kernel.execution.execution_models import (
@@ -205,7 +205,7 @@ class TaskOrchestrator:
                 # Verify ALL dependencies are satisfied
                 # (could depend on completed server tasks too)
                 can_add = True
-                completed_ids = state.get_completed_task_ids()
+                completed_ids = state.completed_task_ids
                 chain_ids = {t.task_id for t in chain}
                 
                 for dep_id in pending_task.depends_on:
@@ -238,7 +238,7 @@ class TaskOrchestrator:
         if not task or not task.depends_on:
             return True
         
-        completed_ids = state.get_completed_task_ids()
+        completed_ids = state.completed_task_ids
         
         for dep_id in task.depends_on:
             if dep_id not in completed_ids:
@@ -263,7 +263,7 @@ class TaskOrchestrator:
             
             task = state.get_task(task_id)
             if task:
-                task.status = "running"
+                state.update_task_status(task.task_id, "running")
                 task.started_at = datetime.now()
                 state.updated_at = datetime.now()
                 logger.info(f"[{user_id}] Task {task_id} started")
@@ -286,7 +286,7 @@ class TaskOrchestrator:
 
             task = state.get_task(task_id)
             if task:
-                task.status = "waiting"
+                state.update_task_status(task.task_id, "waiting")
                 task.started_at = datetime.now()
                 task.approval_state = "requested"
                 task.approval_request_id = request_id
@@ -328,7 +328,7 @@ class TaskOrchestrator:
                 )
                 return False
 
-            task.status = "pending"
+            state.update_task_status(task.task_id, "pending")
             task.started_at = None
             task.completed_at = None
             task.error = None
@@ -387,29 +387,39 @@ class TaskOrchestrator:
             
             task = state.get_task(task_id)
             if task:
-                task.status = "completed"
-                task.output = output
-                task.completed_at = datetime.now()
-                
-                if task.started_at:
-                    duration = (task.completed_at - task.started_at).total_seconds() * 1000
-                    task.duration_ms = int(duration)
-                
-                state.updated_at = datetime.now()
-                logger.info(f"[{user_id}] Task {task_id} completed in {task.duration_ms}ms")
-                await emit_kernel_event(
-                    KernelEvent(
-                        event_type="task_completed",
-                        user_id=user_id,
-                        task_id=task_id,
-                        tool_name=task.tool,
-                        status="completed",
-                        payload={
-                            "duration_ms": task.duration_ms,
-                            "output_success": output.success,
-                        },
-                    )
-                )
+                await self._complete_task_locked(user_id, state, task, output)
+    
+    async def _complete_task_locked(
+        self,
+        user_id: str,
+        state: ExecutionState,
+        task: TaskRecord,
+        output: TaskOutput,
+    ) -> None:
+        """Completion body — caller must hold the user lock."""
+        state.update_task_status(task.task_id, "completed")
+        task.output = output
+        task.completed_at = datetime.now()
+        
+        if task.started_at:
+            duration = (task.completed_at - task.started_at).total_seconds() * 1000
+            task.duration_ms = int(duration)
+        
+        state.updated_at = datetime.now()
+        logger.info(f"[{user_id}] Task {task.task_id} completed in {task.duration_ms}ms")
+        await emit_kernel_event(
+            KernelEvent(
+                event_type="task_completed",
+                user_id=user_id,
+                task_id=task.task_id,
+                tool_name=task.tool,
+                status="completed",
+                payload={
+                    "duration_ms": task.duration_ms,
+                    "output_success": output.success,
+                },
+            )
+        )
     
     async def mark_task_failed(
         self, 
@@ -429,32 +439,42 @@ class TaskOrchestrator:
             
             task = state.get_task(task_id)
             if task:
-                task.status = "failed"
-                task.error = error
-                task.completed_at = datetime.now()
-                
-                if task.started_at:
-                    duration = (task.completed_at - task.started_at).total_seconds() * 1000
-                    task.duration_ms = int(duration)
-                
-                state.updated_at = datetime.now()
-                logger.error(f"[{user_id}] Task {task_id} failed: {error}")
-                await emit_kernel_event(
-                    KernelEvent(
-                        event_type="task_failed",
-                        user_id=user_id,
-                        task_id=task_id,
-                        tool_name=task.tool,
-                        status="failed",
-                        payload={
-                            "duration_ms": task.duration_ms,
-                            "error": error,
-                        },
-                    )
-                )
-                
-                # CASCADE FAILURE: Mark dependent tasks as failed too
-                await self._cascade_failure(user_id, task_id)
+                await self._fail_task_locked(user_id, state, task, error)
+    
+    async def _fail_task_locked(
+        self,
+        user_id: str,
+        state: ExecutionState,
+        task: TaskRecord,
+        error: str,
+    ) -> None:
+        """Failure body (with cascade) — caller must hold the user lock."""
+        state.update_task_status(task.task_id, "failed")
+        task.error = error
+        task.completed_at = datetime.now()
+        
+        if task.started_at:
+            duration = (task.completed_at - task.started_at).total_seconds() * 1000
+            task.duration_ms = int(duration)
+        
+        state.updated_at = datetime.now()
+        logger.error(f"[{user_id}] Task {task.task_id} failed: {error}")
+        await emit_kernel_event(
+            KernelEvent(
+                event_type="task_failed",
+                user_id=user_id,
+                task_id=task.task_id,
+                tool_name=task.tool,
+                status="failed",
+                payload={
+                    "duration_ms": task.duration_ms,
+                    "error": error,
+                },
+            )
+        )
+        
+        # CASCADE FAILURE: Mark dependent tasks as failed too
+        await self._cascade_failure(user_id, task.task_id)
     
     async def _cascade_failure(self, user_id: str, failed_task_id: str) -> None:
         """
@@ -471,7 +491,7 @@ class TaskOrchestrator:
         
         for task in pending_tasks:
             if failed_task_id in task.depends_on:
-                task.status = "failed"
+                state.update_task_status(task.task_id, "failed")
                 task.error = f"Dependency '{failed_task_id}' failed"
                 task.completed_at = datetime.now()
                 logger.warning(
@@ -491,7 +511,7 @@ class TaskOrchestrator:
             
             task = state.get_task(task_id)
             if task:
-                task.status = "emitted"
+                state.update_task_status(task.task_id, "emitted")
                 task.emitted_at = datetime.now()
                 task.started_at = datetime.now()
                 state.updated_at = datetime.now()
@@ -523,36 +543,72 @@ class TaskOrchestrator:
         
         task = state.get_task(task_id)
         if task:
-            task.ack_received_at = datetime.now()
-            latency_ms = None
-            if task.started_at and task.ack_received_at:
-                latency_ms = int((task.ack_received_at - task.started_at).total_seconds() * 1000)
-            
+            await self._record_client_ack(user_id, task, output)
             if output.success:
-                await emit_kernel_event(
-                    KernelEvent(
-                        event_type="tool_invoked",
-                        user_id=user_id,
-                        task_id=task_id,
-                        tool_name=task.tool,
-                        status="success",
-                        payload={"latency_ms": latency_ms},
-                    )
-                )
                 await self.mark_task_completed(user_id, task_id, output)
             else:
-                error = output.error or "Client execution failed"
-                await emit_kernel_event(
-                    KernelEvent(
-                        event_type="tool_failed",
-                        user_id=user_id,
-                        task_id=task_id,
-                        tool_name=task.tool,
-                        status="failed",
-                        payload={"latency_ms": latency_ms, "error": error},
-                    )
+                await self.mark_task_failed(user_id, task_id, output.error or "Client execution failed")
+    
+    async def handle_client_ack_bulk(
+        self,
+        user_id: str,
+        acks: List[Tuple[str, TaskOutput]],
+    ) -> None:
+        """
+        Apply a batch of client acknowledgments under a single lock.
+        
+        Same per-task semantics as ``handle_client_ack``, but the whole batch
+        is one state transition instead of a lock round-trip per result.
+        """
+        if not acks:
+            return
+        
+        async with self._get_lock(user_id):
+            state = self.states.get(user_id)
+            if not state:
+                return
+            
+            for task_id, output in acks:
+                task = state.get_task(task_id)
+                if not task:
+                    continue
+                await self._record_client_ack(user_id, task, output)
+                if output.success:
+                    await self._complete_task_locked(user_id, state, task, output)
+                else:
+                    error = output.error or "Client execution failed"
+                    await self._fail_task_locked(user_id, state, task, error)
+    
+    async def _record_client_ack(self, user_id: str, task: TaskRecord, output: TaskOutput) -> None:
+        """Stamp ack time and emit the tool_invoked / tool_failed event."""
+        task.ack_received_at = datetime.now()
+        latency_ms = None
+        if task.started_at and task.ack_received_at:
+            latency_ms = int((task.ack_received_at - task.started_at).total_seconds() * 1000)
+        
+        if output.success:
+            await emit_kernel_event(
+                KernelEvent(
+                    event_type="tool_invoked",
+                    user_id=user_id,
+                    task_id=task.task_id,
+                    tool_name=task.tool,
+                    status="success",
+                    payload={"latency_ms": latency_ms},
                 )
-                await self.mark_task_failed(user_id, task_id, error)
+            )
+        else:
+            error = output.error or "Client execution failed"
+            await emit_kernel_event(
+                KernelEvent(
+                    event_type="tool_failed",
+                    user_id=user_id,
+                    task_id=task.task_id,
+                    tool_name=task.tool,
+                    status="failed",
+                    payload={"latency_ms": latency_ms, "error": error},
+                )
+            )
     
     def get_state(self, user_id: str) -> Optional[ExecutionState]:
         """Get user execution state"""
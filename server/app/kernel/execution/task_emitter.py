@@ -55,10 +55,6 @@ class TaskEmitter:
             # Mark as emitted on server side (common for both)
             await self.orchestrator.mark_task_emitted(user_id, task.task_id)
             
-            # Serialize
-            task_dict = task.model_dump(mode='json')
-            task_dict = self._enrich_with_server_state(user_id, task_dict)
-            
             # ROUTING LOGIC
             if self.environment == "DESKTOP":
                 # Desktop execution is already handled inside kernel execution engine.
@@ -84,8 +80,9 @@ class TaskEmitter:
             
         try:
             # Mark all as emitted
-            for task in tasks:
-                await self.orchestrator.mark_task_emitted(user_id, task.task_id)
+            await asyncio.gather(
+                *(self.orchestrator.mark_task_emitted(user_id, task.task_id) for task in tasks)
+            )
             
             # ROUTING LOGIC
             if self.environment == "DESKTOP":
@@ -104,6 +101,22 @@ class TaskEmitter:
             logger.error(f"Failed to emit batch: {e}")
             return False
 
+    async def push_task(self, user_id: str, task: TaskRecord) -> bool:
+        """Queue a ready task for a coalesced batch emit (production only)."""
+        if self.environment == "DESKTOP":
+            logger.info("Desktop mode: task %s handled in-process by kernel engine", task.task_id)
+            return True
+        
+        if not self.socket_handler:
+            logger.warning("Socket handler not set in production mode")
+            return False
+        
+        try:
+            return await self.socket_handler.push_task(user_id, task)
+        except Exception as e:
+            logger.error(f"Failed to queue task {task.task_id}: {e}")
+            return False
+
     async def emit_acknowledgment(self, user_id: str, message: str) -> bool:
         """Emit SQH acknowledgment (past tense confirmation)"""
         try:
@@ -210,27 +223,6 @@ class TaskEmitter:
             coordinator.cancel_request(user_id, task_id)
             logger.error(f"Failed to submit approval request: {e}")
             return False
-    
-    def _enrich_with_server_state(self, user_id: str, task_dict: dict) -> dict:
-        """Enrich task dict with server-side dependency completion info"""
-        state = self.orchestrator.get_state(user_id)
-        if not state:
-            return task_dict
-        
-        depends_on = task_dict.get('task', {}).get('depends_on', [])
-        if not depends_on:
-            return task_dict
-        
-        completed_deps = []
-        for dep_id in depends_on:
-            dep_task = state.get_task(dep_id)
-            if dep_task and dep_task.status == "completed":
-                completed_deps.append(dep_id)
-        
-        if completed_deps:
-            task_dict['server_completed_dependencies'] = completed_deps
-        
-        return task_dict
 
 
 # Global singleton
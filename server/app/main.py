@@ -85,6 +85,11 @@ async def lifespan(app: FastAPI):
     logger.info(" Application shutting down...")
     logger.info("=" * 60)
     
+    # Flush pending batched socket emits, stop the TTS worker
+    from app.socket.utils import batched_emitter, tts_dispatcher
+    await batched_emitter.stop()
+    await tts_dispatcher.stop()
+
     # Flush kernel persistence
     await get_kernel_runtime().stop()
     logger.info(" Kernel runtime stopped")
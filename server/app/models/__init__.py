@@ -1,8 +1,10 @@
 from pydantic import BaseModel, ConfigDict
 from typing import Any
+from functools import lru_cache
 from importlib import import_module
 
 
+@lru_cache(maxsize=None)
 def to_camel(string: str) -> str:
     parts = string.split("_")
     return parts[0] + "".join(word.capitalize() for word in parts[1:])
@@ -12,8 +12,9 @@ import os
 import platform
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Dict, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -64,6 +65,17 @@ class PathLayout:
     tools: ToolPaths
 
 
+@lru_cache(maxsize=None)
+def _platform_default_dir(system: str) -> Path:
+    # Path.home() can fall back to a passwd lookup; resolve it once per process
+    home = Path.home()
+    if system == "Windows":
+        return home / "AppData" / "Local" / "SparkAI"
+    if system == "Darwin":
+        return home / "Library" / "Application Support" / "SparkAI"
+    return home / ".local" / "share" / "SparkAI"
+
+
 class PathManager:
     """
     Canonical path service for the server/runtime.
@@ -73,6 +85,11 @@ class PathManager:
     so existing code does not break while we migrate.
     """
 
+    # (primary, fallback) -> directory that passed the writability probe.
+    # Shared across instances so repeat PathManager() calls skip the
+    # mkdir/write/unlink round trip for directories already verified.
+    _ensured: ClassVar[Dict[Tuple[Path, Path], Path]] = {}
+
     def __init__(self, env: Optional[dict] = None):
         self.env = env or os.environ
         self.system = platform.system()
@@ -106,11 +123,7 @@ class PathManager:
         return candidates[0]
 
     def _default_user_data_dir(self) -> Path:
-        if self.system == "Windows":
-            return Path.home() / "AppData" / "Local" / "SparkAI"
-        if self.system == "Darwin":
-            return Path.home() / "Library" / "Application Support" / "SparkAI"
-        return Path.home() / ".local" / "share" / "SparkAI"
+        return _platform_default_dir(self.system)
 
     def _setup_paths(self) -> None:
         if getattr(sys, "frozen", False):
@@ -336,14 +349,19 @@ class PathManager:
                 keep.append("_")
         return "".join(keep)
 
-    @staticmethod
-    def _ensure_writable_dir(primary: Path, fallback: Path) -> Path:
+    @classmethod
+    def _ensure_writable_dir(cls, primary: Path, fallback: Path) -> Path:
+        key = (primary, fallback)
+        ensured = cls._ensured.get(key)
+        if ensured is not None:
+            return ensured
         for candidate in (primary, fallback):
             try:
                 candidate.mkdir(parents=True, exist_ok=True)
                 test_file = candidate / ".write_test"
                 test_file.write_text("ok", encoding="utf-8")
                 test_file.unlink(missing_ok=True)
+                cls._ensured[key] = candidate
                 return candidate
             except Exception:
                 continue
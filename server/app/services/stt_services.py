@@ -292,7 +292,7 @@ class WhisperService:
                 "error": str(e)
             }
     
-    @make_async
+    @make_async(cpu_bound=True)
     def transcribe(
         self,
         audio_data: Any,
@@ -309,7 +309,7 @@ class WhisperService:
         """
         return self._transcribe_sync(audio_data, mime_type, language, **kwargs)
     
-    @make_async
+    @make_async(cpu_bound=True)
     def transcribe_simple(
         self,
         audio_data: Any,
@@ -325,7 +325,7 @@ class WhisperService:
         result = self._transcribe_sync(audio_data, mime_type, **kwargs)
         return result.get("text", "[Transcription failed]")
     
-    @make_async
+    @make_async(cpu_bound=True)
     def detect_language(
         self,
         audio_data: Any,
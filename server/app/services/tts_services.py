@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 import uuid
-from typing import AsyncGenerator, Callable, Optional, Any
+from typing import AsyncGenerator, Callable, List, Optional, Any, Union
 from app.services.tts.manager import tts_manager
 from app.services.tts.voice_selector import VoiceSelector
 
@@ -26,13 +26,13 @@ class TTSService:
     def _normalize_text(text: str) -> str:
         return " ".join(text.strip().lower().split())
 
-    async def _is_duplicate_request(self, sid: str, text: str) -> bool:
+    async def _is_duplicate_request(self, sid: Union[str, List[str]], text: str) -> bool:
         normalized = self._normalize_text(text)
         if not normalized:
             return False
 
         now = time.monotonic()
-        key = (sid, normalized)
+        key = (sid if isinstance(sid, str) else ",".join(sid), normalized)
 
         async with self._dedupe_lock:
             # Keep map bounded by pruning stale entries.
@@ -133,7 +133,7 @@ class TTSService:
     async def stream_to_socket(
         self,
         sio: Any,
-        sid: str,
+        sid: Union[str, List[str]],
         text: str,
         voice: Optional[str] = None,
         rate: Optional[str] = None,
@@ -146,6 +146,10 @@ class TTSService:
         """
         Stream TTS audio to a WebSocket client.
 
+        ``sid`` may also be a room name (e.g. ``user:{id}``) or a list of
+        rooms: audio is synthesized once and each chunk is emitted once to
+        every session in them.
+
         Each event carries a unique ``stream_id`` so the client can associate
         chunks with the correct stream and reject stale data.
         """
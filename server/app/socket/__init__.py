@@ -25,7 +25,8 @@ __all__ = [
 def init_socket():
     """
     One-time initialization — call in main.py lifespan.
-    Registers all socket event handlers (chat, TTS, tasks).
+    Registers all socket event handlers (chat, TTS, tasks) and starts
+    the batched emitter and TTS workers (must run inside the event loop).
     """
     import logging
     logger = logging.getLogger(__name__)
@@ -38,4 +39,10 @@ def init_socket():
     from app.socket.log_stream import register_log_stream
     register_log_stream()
 
+    # Start coalescing per-sid emits into batched frames, and the single
+    # worker behind fire_tts
+    from app.socket.utils import batched_emitter, tts_dispatcher
+    batched_emitter.start()
+    tts_dispatcher.start()
+
     logger.info("✅ Socket module fully initialized")
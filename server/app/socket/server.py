@@ -6,6 +6,7 @@ connect/disconnect events with JWT authentication.
 """
 
 import os
+import orjson
 import socketio
 import logging
 from typing import Dict, Set
@@ -23,8 +24,26 @@ _sio_logger.setLevel(logging.WARNING)
 _eio_logger = logging.getLogger("engineio")
 _eio_logger.setLevel(logging.WARNING)
 
+class _OrjsonCodec:
+    """
+    stdlib-``json``-compatible shim over orjson for Socket.IO packets.
+
+    python-socketio calls ``dumps(data, separators=...)`` and ``loads(str)``;
+    orjson is already compact, so extra kwargs are ignored.
+    """
+
+    @staticmethod
+    def dumps(obj, **_kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(data, **_kwargs):
+        return orjson.loads(data)
+
+
 sio = socketio.AsyncServer(
     async_mode="asgi",
+    json=_OrjsonCodec,
     cors_allowed_origins="*",
     logger=_sio_logger,
     engineio_logger=_eio_logger,
@@ -37,6 +56,12 @@ socket_app = socketio.ASGIApp(sio)
 
 # Support multiple connections per user (multi-tab / multi-device)
 connected_users: Dict[str, Set[str]] = {}  # user_id → set of sids
+sid_to_user: Dict[str, str] = {}  # sid → user_id (reverse index of connected_users)
+
+
+def user_room(user_id: str) -> str:
+    """Socket.IO room every sid of ``user_id`` joins on connect."""
+    return f"user:{user_id}"
 
 
 # ==================== CONNECTION LIFECYCLE ====================
@@ -88,12 +113,13 @@ async def connect(sid, environ, auth):
         })
 
         # Track multiple connections per user
-        if user_id not in connected_users:
-            connected_users[user_id] = set()
-        connected_users[user_id].add(sid)
+        user_sids = connected_users.setdefault(user_id, set())
+        user_sids.add(sid)
+        sid_to_user[sid] = user_id
+        await sio.enter_room(sid, user_room(user_id))
 
         # Activate user-scoped API keys (priority over system keys)
-        if len(connected_users[user_id]) == 1:
+        if len(user_sids) == 1:
             try:
                 from app.cache import get_user_details
                 user_data = await get_user_details(user_id)
@@ -105,7 +131,7 @@ async def connect(sid, environ, auth):
 
         logger.info(
             f"🟢 User {user_id} connected with sid {sid} "
-            f"(total connections: {len(connected_users[user_id])})"
+            f"(total connections: {len(user_sids)})"
         )
         return True
 
@@ -124,10 +150,13 @@ async def disconnect(sid):
         user_id = session.get("user_id")
         client_type = session.get("client_type")
 
-        if user_id and user_id in connected_users:
-            connected_users[user_id].discard(sid)
+        sid_to_user.pop(sid, None)
+
+        user_sids = connected_users.get(user_id) if user_id else None
+        if user_sids is not None:
+            user_sids.discard(sid)
 
-            if not connected_users[user_id]:
+            if not user_sids:
                 del connected_users[user_id]
                 get_approval_coordinator().cancel_user_requests(user_id)
                 # Deactivate user-scoped API keys
@@ -146,7 +175,7 @@ async def disconnect(sid):
             else:
                 logger.info(
                     f"🔌 User {user_id} disconnected sid {sid} "
-                    f"({len(connected_users[user_id])} connections remaining)"
+                    f"({len(user_sids)} connections remaining)"
                 )
         elif client_type == "daemon":
             logger.info("🤖 Daemon disconnected sid %s", sid)
@@ -8,16 +8,44 @@ Client gets same data access as server orchestrator
 
 import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 import socketio
+from pydantic import TypeAdapter
 
 from app.agent.execution_gateway import get_orchestrator, TaskOutput, TaskRecord
+from app.kernel.execution.execution_models import TaskBatchWire
 from app.kernel.execution.approval_coordinator import get_approval_coordinator
 from app.services.chat.tool_output_delivery_service import get_tool_output_delivery_service
+from app.socket.server import user_room
+from app.socket.utils import batched_emitter
 
 logger = logging.getLogger(__name__)
 
 
+# Columnar batch → JSON bytes in one pydantic-core call (no per-task dict round-trip)
+_TASK_BATCH_WIRE_ADAPTER = TypeAdapter(TaskBatchWire)
+
+
+# Per-user debounce before task:execute_batch — flush after this long or at
+# this many tasks, whichever comes first. The queue bound applies backpressure.
+TASK_DEBOUNCE_S = 0.010
+TASK_DEBOUNCE_MAX = 64
+TASK_QUEUE_MAXSIZE = 256
+
+
+# Validator built once and reused for every client ack
+_TASK_OUTPUT_ADAPTER = TypeAdapter(TaskOutput)
+
+
+def _parse_task_output(result: Dict[str, Any]) -> TaskOutput:
+    """Validate a client result payload into TaskOutput (missing keys defaulted)."""
+    return _TASK_OUTPUT_ADAPTER.validate_python({
+        "success": result.get("success", False),
+        "data": result.get("data", {}),
+        "error": result.get("error"),
+    })
+
+
 class SocketTaskHandler:
     """
     Production WebSocket task handler
@@ -33,6 +61,12 @@ class SocketTaskHandler:
         self.sio = sio
         self.connected_users = connected_users
         self.orchestrator = get_orchestrator()
+        self._task_queues: Dict[str, asyncio.Queue] = {}
+        self._task_consumers: Dict[str, asyncio.Task] = {}
+    
+    def _snapshot_sids(self, user_id: str) -> Tuple[str, ...]:
+        """Immutable snapshot of the user's sids (safe against connect/disconnect churn)."""
+        return tuple(self.connected_users.get(user_id, ()))
     
     async def emit_task_single(self, user_id: str, task: TaskRecord) -> bool:
         """
@@ -42,27 +76,23 @@ class SocketTaskHandler:
         ✅ Enriches with server-side dependency completion info
         """
         # Check if user is connected
-        if user_id not in self.connected_users or not self.connected_users[user_id]:
+        sids = self._snapshot_sids(user_id)
+        if not sids:
             logger.warning(f"⚠️  User {user_id} not connected - cannot emit task {task.task_id}")
             return False
         
         # Get one of the user's socket IDs
-        sid = next(iter(self.connected_users[user_id]))
+        sid = sids[0]
         
         try:
-            # Serialize to JSON dict
-            task_dict = task.model_dump(mode='json')
-            
-            # ✅ Enrich with server-side dependency state
-            task_dict = self._enrich_with_server_state(user_id, task_dict)
-            
-            # ✅ Always send as array with user_id
+            # ✅ Same columnar attachment as task:execute_batch, one row long
             payload = {
                 "user_id": user_id,
-                "tasks": [task_dict]  # Single task in array
+                "tasks": self._encode_tasks(user_id, [task]),
             }
             
-            # Emit to client
+            # Emit to client (after any queued task:status / log events)
+            await batched_emitter.flush()
             await self.sio.emit(
                 "task:execute",
                 payload,
@@ -72,7 +102,7 @@ class SocketTaskHandler:
             # Mark as emitted
             await self.orchestrator.mark_task_emitted(user_id, task.task_id)
             
-            logger.info(f"📤 Emitted task {task.task_id} to client {user_id}")
+            logger.info("📤 Emitted task %s to client %s", task.task_id, user_id)
             return True
             
         except Exception as e:
@@ -88,79 +118,118 @@ class SocketTaskHandler:
         This is MUCH faster than individual emissions!
         """
         # Check if user is connected
-        if user_id not in self.connected_users or not self.connected_users[user_id]:
+        sids = self._snapshot_sids(user_id)
+        if not sids:
             logger.warning(f"⚠️  User {user_id} not connected - cannot emit batch")
             return False
         
-        sid = next(iter(self.connected_users[user_id]))
+        sid = sids[0]
         
         try:
-            # Serialize all to JSON dicts
-            task_dicts = [task.model_dump(mode='json') for task in tasks]
-            
-            # ✅ Enrich with server-side dependency state
-            task_dicts = [self._enrich_with_server_state(user_id, td) for td in task_dicts]
-            
-            # ✅ Send as array with user_id (consistent interface)
+            # ✅ Tasks go as one binary JSON attachment in column (SoA) form;
+            # the envelope stays small. Client rebuilds rows from the columns.
             payload = {
                 "user_id": user_id,
-                "tasks": task_dicts
+                "tasks": self._encode_tasks(user_id, tasks),
             }
             
-            # Emit to client
+            # Emit to client (after any queued task:status / log events)
+            await batched_emitter.flush()
             await self.sio.emit(
                 "task:execute_batch",
                 payload,
                 room=sid
             )
             
-            # Mark all as emitted
-            for task in tasks:
-                await self.orchestrator.mark_task_emitted(user_id, task.task_id)
+            # Mark all as emitted (independent updates — overlap them)
+            await asyncio.gather(
+                *(self.orchestrator.mark_task_emitted(user_id, task.task_id) for task in tasks)
+            )
             
-            logger.info(f"📦 Emitted batch of {len(tasks)} tasks to client {user_id}")
+            logger.info("📦 Emitted batch of %d tasks to client %s", len(tasks), user_id)
             return True
             
         except Exception as e:
             logger.error(f"❌ Failed to emit batch: {e}")
             return False
     
-    def _enrich_with_server_state(self, user_id: str, task_dict: dict) -> dict:
+    async def push_task(self, user_id: str, task: TaskRecord) -> bool:
         """
-        Enrich task dict with server-side dependency completion info.
+        Queue a ready task for the user's next coalesced batch emit.
         
-        For tasks being sent to client, we need to include info about
-        which dependencies were already completed on the server side.
-        
-        Args:
-            user_id: User ID
-            task_dict: Task dictionary to enrich
-            
-        Returns:
-            Enriched task dictionary with 'server_completed_dependencies' field
+        Tasks pushed within TASK_DEBOUNCE_S of each other (up to
+        TASK_DEBOUNCE_MAX) go out as one task:execute_batch frame.
+        Blocks while the user's queue is full.
         """
-        state = self.orchestrator.get_state(user_id)
-        if not state:
-            return task_dict
-        
-        # Get the task's dependencies
-        depends_on = task_dict.get('task', {}).get('depends_on', [])
-        if not depends_on:
-            return task_dict
+        if not self.connected_users.get(user_id):
+            logger.warning(f"⚠️  User {user_id} not connected - cannot queue task {task.task_id}")
+            return False
         
-        # Check which dependencies are completed on server
-        completed_deps = []
-        for dep_id in depends_on:
-            dep_task = state.get_task(dep_id)
-            if dep_task and dep_task.status == "completed":
-                completed_deps.append(dep_id)
+        queue = self._task_queues.get(user_id)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=TASK_QUEUE_MAXSIZE)
+            self._task_queues[user_id] = queue
+            self._task_consumers[user_id] = asyncio.create_task(
+                self._drain_task_queue(user_id, queue)
+            )
+        await queue.put(task)
+        return True
+    
+    async def _drain_task_queue(self, user_id: str, queue: asyncio.Queue) -> None:
+        """Per-user consumer: collect a debounced batch, emit it, exit when idle."""
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + TASK_DEBOUNCE_S
+                while len(batch) < TASK_DEBOUNCE_MAX:
+                    # Take whatever is already queued without a wait_for per item
+                    if not queue.empty():
+                        batch.append(queue.get_nowait())
+                        continue
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                
+                if not await self.emit_task_batch(user_id, batch):
+                    logger.warning("⚠️  Dropped batch of %d queued tasks for %s", len(batch), user_id)
+                
+                if queue.empty():
+                    break
+        finally:
+            # No await between the empty() check and here, so a concurrent
+            # push_task either landed before it or starts a fresh consumer.
+            if self._task_queues.get(user_id) is queue:
+                del self._task_queues[user_id]
+                self._task_consumers.pop(user_id, None)
+    
+    def _encode_tasks(self, user_id: str, tasks: List[TaskRecord]) -> bytes:
+        """
+        Columnar JSON bytes for a task:execute / task:execute_batch payload.
         
-        # Add metadata about completed dependencies
-        if completed_deps:
-            task_dict['server_completed_dependencies'] = completed_deps
-            logger.info(f"   📊 Task {task_dict.get('task_id')} has {len(completed_deps)} server-completed deps: {completed_deps}")
+        Server-side completed dependencies are looked up once, and only if
+        some task has dependencies; the column is omitted when none apply.
+        """
+        server_completed: Dict[str, List[str]] = {}
+        if any(task.depends_on for task in tasks):
+            completed = self._completed_task_ids(user_id)
+            for task in tasks:
+                completed_deps = [d for d in task.depends_on if d in completed]
+                if completed_deps:
+                    server_completed[task.task_id] = completed_deps
         
-        return task_dict
+        wire = TaskBatchWire.from_records(tasks, server_completed)
+        exclude = None if server_completed else {"server_completed_dependencies"}
+        return _TASK_BATCH_WIRE_ADAPTER.dump_json(wire, exclude=exclude)
+    
+    def _completed_task_ids(self, user_id: str) -> Set[str]:
+        """Server-side completed task ids for the user (empty if no state)."""
+        state = self.orchestrator.get_state(user_id)
+        return state.completed_task_ids if state else set()
     
     async def handle_task_result(
         self, 
@@ -175,16 +244,12 @@ class SocketTaskHandler:
         """
         try:
             # Parse result into TaskOutput
-            output = TaskOutput(
-                success=result.get("success", False),
-                data=result.get("data", {}),
-                error=result.get("error")
-            )
+            output = _parse_task_output(result)
             
             # Update orchestrator (no lock needed - called from socket handler)
             await self.orchestrator.handle_client_ack(user_id, task_id, output)
             
-            logger.info(f"✅ Received result for task {task_id} from {user_id}")
+            logger.info("✅ Received result for task %s from %s", task_id, user_id)
             
         except Exception as e:
             logger.error(f"❌ Failed to handle task result: {e}")
@@ -194,6 +259,48 @@ class SocketTaskHandler:
                 f"Failed to process client result: {str(e)}"
             )
     
+    async def handle_task_results(
+        self,
+        user_id: str,
+        items: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Handle a batch of task results from the client
+        
+        Parses every item up front, then applies all acks in one
+        orchestrator transaction. Unparseable items are failed individually,
+        and if the bulk apply raises, every task in it is failed too.
+        """
+        acks: List[Tuple[str, TaskOutput]] = []
+        rejected: List[Tuple[str, str]] = []
+        for item in items:
+            task_id = item.get("task_id")
+            if not task_id:
+                continue
+            result = item.get("result", {})
+            try:
+                acks.append((task_id, _parse_task_output(result)))
+            except Exception as e:
+                rejected.append((task_id, f"Failed to process client result: {str(e)}"))
+        
+        if rejected:
+            logger.error(f"❌ Failed to parse {len(rejected)} batch results from {user_id}")
+        
+        try:
+            await self.orchestrator.handle_client_ack_bulk(user_id, acks)
+        except Exception as e:
+            logger.error(f"❌ Failed to handle {len(acks)} batch results from {user_id}: {e}")
+            rejected.extend(
+                (task_id, f"Failed to process client result: {str(e)}")
+                for task_id, _ in acks
+            )
+        
+        if rejected:
+            await asyncio.gather(*(
+                self.orchestrator.mark_task_failed(user_id, task_id, error)
+                for task_id, error in rejected
+            ))
+    
     async def notify_task_status(
         self, 
         user_id: str, 
@@ -204,7 +311,7 @@ class SocketTaskHandler:
         Notify client about task status change
         (Optional - for real-time UI updates)
         """
-        if user_id not in self.connected_users:
+        if not self.connected_users.get(user_id):
             return
         
         payload = {
@@ -212,20 +319,13 @@ class SocketTaskHandler:
             "status": status
         }
         
-        # Emit to all user's connections
-        for sid in self.connected_users[user_id]:
-            try:
-                await self.sio.emit(
-                    "task:status",
-                    payload,
-                    room=sid
-                )
-            except Exception as e:
-                logger.error(f"Failed to notify status: {e}")
+        # One emit to the user room reaches every connection (coalesced);
+        # stale sids leave the room on disconnect, so no per-sid guarding
+        await batched_emitter.emit(user_room(user_id), "task:status", payload)
 
     async def emit_approval_request(self, user_id: str, task_id: str, question: str) -> bool:
         """Emit approval request to the connected client without waiting for a reply."""
-        if user_id not in self.connected_users or not self.connected_users[user_id]:
+        if not self.connected_users.get(user_id):
             logger.warning("⚠️ User %s not connected - cannot request approval for %s", user_id, task_id)
             return False
 
@@ -236,8 +336,8 @@ class SocketTaskHandler:
         }
 
         try:
-            for sid in self.connected_users[user_id]:
-                await self.sio.emit("task:approval:request", payload, room=sid)
+            await batched_emitter.flush()
+            await self.sio.emit("task:approval:request", payload, room=user_room(user_id))
             logger.info("📨 Approval requested for %s/%s", user_id, task_id)
             return True
         except Exception as exc:
@@ -311,14 +411,13 @@ async def register_task_events(
             user_id = data.get("user_id")
             results = data.get("results", [])
             
-            for item in results:
-                task_id = item.get("task_id")
-                result = item.get("result", {})
-                
-                if task_id:
-                    await handler.handle_task_result(user_id, task_id, result) #type: ignore
+            if not user_id:
+                logger.error("Missing user_id in batch results")
+                return
+            
+            await handler.handle_task_results(user_id, results)
             
-            logger.info(f"✅ Processed {len(results)} batch results from {user_id}")
+            logger.info("✅ Processed %d batch results from %s", len(results), user_id)
             
         except Exception as e:
             logger.error(f"Error handling batch results: {e}")
@@ -7,8 +7,8 @@ This integrates with the new streaming architecture:
 - Generates audio in real-time
 - Sends audio chunks to frontend instantly
 """
-import logging, asyncio
-from typing import Any, Callable, Awaitable
+import logging, asyncio, time
+from typing import Any, Callable, Awaitable, Dict, Optional, Tuple
 from app.schemas import RequestTTS
 from app.socket.server import sio
 from app.socket.utils import emit_server_status
@@ -20,6 +20,44 @@ from app.services.tts_services import tts_service
 logger = logging.getLogger(__name__)
 
 
+# ==================== USER PREFERENCE CACHE ====================
+
+_PREFS_TTL_SECONDS = 30.0
+
+# user_id → (expires_at monotonic, {"gender", "lang", "voice_name"})
+_user_prefs_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+async def _load_tts_prefs(user_id: str) -> Dict[str, Any]:
+    """
+    Voice preferences for a user, cached for a short TTL.
+
+    Consecutive TTS requests from the same user skip the load_user round-trip.
+    """
+    now = time.monotonic()
+    cached = _user_prefs_cache.get(user_id)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    user = await load_user(user_id)
+    prefs = {
+        "gender": (user.get("ai_gender") or "").strip().lower(),
+        "lang": (user.get("language") or "").strip().lower(),
+        "voice_name": (user.get("ai_voice_name") or "").strip() or None,
+    }
+    if user:
+        _user_prefs_cache[user_id] = (now + _PREFS_TTL_SECONDS, prefs)
+    return prefs
+
+
+def invalidate_tts_prefs(user_id: Optional[str] = None) -> None:
+    """Drop cached voice preferences (one user, or everyone when None)."""
+    if user_id is None:
+        _user_prefs_cache.clear()
+    else:
+        _user_prefs_cache.pop(user_id, None)
+
+
 async def handle_tts_request(
     sio: Any,
     sid: str,
@@ -67,10 +105,10 @@ async def handle_tts_request(
             return
         
         # Load user preferences
-        user = await load_user(user_id)
-        gender = user.get("ai_gender", "").strip().lower()
-        lang = user.get("language", "").strip().lower()
-        voice_name = (user.get("ai_voice_name") or "").strip() or None
+        prefs = await _load_tts_prefs(user_id)
+        gender = prefs["gender"]
+        lang = prefs["lang"]
+        voice_name = prefs["voice_name"]
         
         await emit_server_status(
             f"Loaded user preferences: gender={gender}, language={lang}",
@@ -172,9 +210,9 @@ async def handle_tts_request_with_parallel_chat(
     
     try:
         user_id = await get_user_from_session(sid)
-        user = await load_user(user_id)
-        gender = user.get("ai_gender", "").strip().lower()
-        voice_name = (user.get("ai_voice_name") or "").strip() or None
+        prefs = await _load_tts_prefs(user_id)
+        gender = prefs["gender"]
+        voice_name = prefs["voice_name"]
         
         # Run both TTS stream and chat in parallel
         result = await _parallel_execute(
@@ -6,7 +6,9 @@ Usage anywhere in the server:
 """
 
 import logging
-from app.socket.server import sio, connected_users
+from typing import Any, Callable, Dict
+
+from app.socket.server import sio, connected_users, sid_to_user, user_room
 
 logger = logging.getLogger(__name__)
 
@@ -29,16 +31,25 @@ async def get_user_from_session(sid: str) -> str:
         raise
 
 
+def snapshot_sids(user_id: str) -> tuple[str, ...]:
+    """
+    Immutable snapshot of a user's socket IDs.
+
+    Iterating the live set across awaits races with connect/disconnect;
+    a tuple is taken with a single dict lookup and never mutates.
+    """
+    return tuple(connected_users.get(user_id, ()))
+
+
 async def send_to_user(user_id: str, event: str, data: dict) -> bool:
     """
     Send event to ALL connections of a specific user.
     Supports multi-device / multi-tab.
     """
-    if user_id in connected_users:
-        sids = connected_users[user_id]
-        for sid in sids:
-            await sio.emit(event, data, to=sid)
-        logger.info(f"📤 Sent {event} to user {user_id} ({len(sids)} connections)")
+    sids = snapshot_sids(user_id)
+    if sids:
+        await sio.emit(event, data, room=user_room(user_id))
+        logger.info("📤 Sent %s to user %s (%d connections)", event, user_id, len(sids))
         return True
     else:
         logger.warning(f"⚠️ User {user_id} not connected")
@@ -52,10 +63,37 @@ def get_connected_users() -> list[str]:
 
 def get_user_by_sid(sid: str) -> str | None:
     """Reverse-lookup: find user_id by session ID."""
-    for user_id, sids in connected_users.items():
-        if sid in sids:
-            return user_id
-    return None
+    return sid_to_user.get(sid)
+
+
+def _serialize_model_dump(chat_res) -> dict:
+    return chat_res.model_dump()
+
+
+def _serialize_legacy_dict(chat_res) -> dict:
+    return chat_res.dict()
+
+
+def _serialize_fallback(chat_res) -> dict:
+    try:
+        return dict(chat_res)
+    except Exception:
+        return {"response": str(chat_res)}
+
+
+# Serializer strategy resolved once per response type, then a dict hit
+_SERIALIZER_CACHE: Dict[type, Callable[[Any], dict]] = {}
+
+
+def _resolve_serializer(cls: type) -> Callable[[Any], dict]:
+    if callable(getattr(cls, "model_dump", None)):
+        serializer = _serialize_model_dump
+    elif callable(getattr(cls, "dict", None)):
+        serializer = _serialize_legacy_dict
+    else:
+        serializer = _serialize_fallback
+    _SERIALIZER_CACHE[cls] = serializer
+    return serializer
 
 
 async def serialize_response(chat_res) -> dict:
@@ -63,12 +101,6 @@ async def serialize_response(chat_res) -> dict:
     if chat_res is None:
         return {"error": "No response from chat service"}
 
-    if hasattr(chat_res, "model_dump") and callable(getattr(chat_res, "model_dump")):
-        return chat_res.model_dump()
-    elif hasattr(chat_res, "dict") and callable(getattr(chat_res, "dict")):
-        return chat_res.dict()
-    else:
-        try:
-            return dict(chat_res)
-        except Exception:
-            return {"response": str(chat_res)}
+    cls = type(chat_res)
+    serializer = _SERIALIZER_CACHE.get(cls) or _resolve_serializer(cls)
+    return serializer(chat_res)
@@ -8,15 +8,221 @@ No initialization needed — imports directly from server.py.
 """
 
 from typing import Any, Optional, Literal
+import asyncio
 import logging
+import time
 from datetime import datetime, timezone
 
-from app.socket.server import sio, connected_users
+from app.services.interrupt_manager import get_interrupt_manager
+from app.socket.server import sio, connected_users, user_room
 from app.socket.user_utils import get_user_by_sid
 
 logger = logging.getLogger(__name__)
 
 
+# ==================== BATCHED EMITTER ====================
+
+BATCH_EVENT = "_batch"
+BATCH_INTERVAL_S = 0.005
+EMIT_QUEUE_MAXSIZE = 10_000
+TTS_QUEUE_MAXSIZE = 256
+
+
+class BatchedEmitter:
+    """
+    Coalesces small per-room emits into a single WebSocket frame.
+
+    Producers push ``(room, event, data)`` via ``emit`` — a room is a sid or a
+    ``user:{user_id}`` room. A background drain loop wakes every ~5 ms, groups
+    pending events by room and sends one ``_batch`` event carrying
+    ``[[event, data], ...]`` per room. A room with a single pending event gets
+    it as a plain emit, so lone events stay wire-compatible. The client
+    unpacks ``_batch`` and redispatches each entry.
+
+    Until ``start()`` runs (or after ``stop()``) emits go straight to ``sio``.
+    The queue is bounded: ``emit`` falls back to a direct send when it is
+    full, ``emit_nowait`` drops the event and logs.
+
+    Code that sends directly on ``sio`` to a room that may also have queued
+    events awaits ``flush()`` first, so the direct send cannot overtake them.
+    """
+
+    def __init__(self, interval: float = BATCH_INTERVAL_S):
+        self._interval = interval
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # Events the drain loop has dequeued but not yet sent (during its sleep)
+        self._held: list[tuple[Optional[str], str, Any]] = []
+        # Serializes sends so a flush never interleaves with the drain loop's
+        self._send_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the drain loop on the running event loop (idempotent)."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=EMIT_QUEUE_MAXSIZE)
+        self._task = asyncio.get_running_loop().create_task(self._drain_loop())
+        logger.info("✅ Batched socket emitter started (%.0f ms window)", self._interval * 1000)
+
+    async def stop(self) -> None:
+        """Stop the drain loop and flush whatever is still queued."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._queue is not None:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Send everything queued so far, in order, before returning."""
+        if self._queue is None:
+            return
+        async with self._send_lock:
+            pending, self._held = self._held, []
+            pending.extend(self._drain_pending())
+            await self._flush(pending)
+
+    async def emit(self, room: Optional[str], event: str, data: Any) -> None:
+        """Queue an event for ``room`` (or emit directly when not running/full)."""
+        if self.running:
+            try:
+                self._queue.put_nowait((room, event, data))  # type: ignore[union-attr]
+                return
+            except asyncio.QueueFull:
+                pass
+        await sio.emit(event, data, room=room)
+
+    def emit_nowait(self, room: Optional[str], event: str, data: Any) -> bool:
+        """
+        Queue an event without awaiting — for sync callers.
+
+        ``room=None`` broadcasts. Returns False when the emitter is not running
+        or the queue is full (the event is dropped and logged).
+        """
+        if not self.running:
+            return False
+        try:
+            self._queue.put_nowait((room, event, data))  # type: ignore[union-attr]
+            return True
+        except asyncio.QueueFull:
+            logger.warning("⚠️ Emit queue full — dropping '%s'", event)
+            return False
+
+    def _drain_pending(self) -> list[tuple[Optional[str], str, Any]]:
+        pending = []
+        while True:
+            try:
+                pending.append(self._queue.get_nowait())  # type: ignore[union-attr]
+            except asyncio.QueueEmpty:
+                return pending
+
+    async def _drain_loop(self) -> None:
+        queue = self._queue
+        while True:
+            self._held.append(await queue.get())  # type: ignore[union-attr]
+            await asyncio.sleep(self._interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"❌ Batched emit flush failed: {e}")
+
+    async def _flush(self, pending: list[tuple[Optional[str], str, Any]]) -> None:
+        if not pending:
+            return
+        by_room: dict[Optional[str], list[list[Any]]] = {}
+        group = by_room.setdefault  # bound once for the grouping loop
+        for room, event, data in pending:
+            group(room, []).append([event, data])
+
+        async def _send(room: Optional[str], events: list[list[Any]]) -> None:
+            if len(events) == 1:
+                event, data = events[0]
+                await sio.emit(event, data, room=room)
+            else:
+                await sio.emit(BATCH_EVENT, events, room=room)
+
+        results = await asyncio.gather(
+            *(_send(room, events) for room, events in by_room.items()),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"❌ Batched emit failed: {result}")
+
+
+batched_emitter = BatchedEmitter()
+
+
+class TTSDispatcher:
+    """
+    Single background worker for ``fire_tts`` requests.
+
+    Sync callers enqueue ``(text, user_id, gender, voice_name)`` on a bounded
+    queue instead of spawning a task per request; the worker awaits
+    ``stream_tts_to_client`` for each in order.
+    """
+
+    def __init__(self, maxsize: int = TTS_QUEUE_MAXSIZE):
+        self._maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the worker on the running event loop (idempotent)."""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self._maxsize)
+        self._task = asyncio.get_running_loop().create_task(self._worker())
+        logger.info("✅ TTS dispatcher started")
+
+    async def stop(self) -> None:
+        """Stop the worker; queued requests are dropped."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def submit(
+        self,
+        text: str,
+        user_id: Optional[str],
+        gender: str,
+        voice_name: Optional[str],
+    ) -> bool:
+        """Queue a TTS request. False when not running or the queue is full."""
+        if not self.running:
+            return False
+        try:
+            self._queue.put_nowait((text, user_id, gender, voice_name))  # type: ignore[union-attr]
+            return True
+        except asyncio.QueueFull:
+            logger.warning("⚠️ TTS queue full — dropping request for user=%s", user_id)
+            return False
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        while True:
+            text, user_id, gender, voice_name = await queue.get()  # type: ignore[union-attr]
+            await _run_tts(text, user_id, gender, voice_name)
+
+
+tts_dispatcher = TTSDispatcher()
+
+
 # ==================== CORE EMIT FUNCTIONS ====================
 
 async def socket_emit(event: str, data: Any, user_id: Optional[str] = None) -> bool:
@@ -29,18 +235,17 @@ async def socket_emit(event: str, data: Any, user_id: Optional[str] = None) -> b
     """
     try:
         if user_id:
-            sids = connected_users.get(user_id, set())
-            if sids:
-                for sid in sids:
-                    await sio.emit(event, data, room=sid)
-                logger.info(f"✅ Emitted '{event}' to user {user_id}")
+            if connected_users.get(user_id):
+                await batched_emitter.emit(user_room(user_id), event, data)
+                logger.debug("✅ Emitted '%s' to user %s", event, user_id)
                 return True
             else:
                 logger.warning(f"⚠️ User {user_id} not connected")
                 return False
         else:
+            await batched_emitter.flush()
             await sio.emit(event, data)
-            logger.info(f"📢 Broadcasted '{event}' to all users")
+            logger.debug("📢 Broadcasted '%s' to all users", event)
             return True
     except Exception as e:
         logger.error(f"❌ Error emitting '{event}': {e}")
@@ -52,17 +257,23 @@ async def socket_emit_to_users(event: str, data: Any, user_ids: list[str]) -> di
     Emit an event to multiple specific users.
     Returns: {'success': int, 'failed': int, 'total': int}
     """
+    is_online = connected_users.get  # bound once for the filter loop
+    online = [uid for uid in user_ids if is_online(uid)]
+
+    # One emit across every recipient room: Socket.IO encodes the packet
+    # exactly once and reuses the bytes for each sid in those rooms
     success_count = 0
-    failed_count = 0
+    if online:
+        try:
+            await batched_emitter.flush()
+            await sio.emit(event, data, room=[user_room(uid) for uid in online])
+            success_count = len(online)
+        except Exception as e:
+            logger.error(f"❌ Error emitting '{event}' to {len(online)} users: {e}")
 
-    for uid in user_ids:
-        result = await socket_emit(event, data, user_id=uid)
-        if result:
-            success_count += 1
-        else:
-            failed_count += 1
+    failed_count = len(user_ids) - success_count
 
-    logger.info(f"📊 Emitted '{event}' — Success: {success_count}, Failed: {failed_count}")
+    logger.info("📊 Emitted '%s' — Success: %d, Failed: %d", event, success_count, failed_count)
     return {
         'success': success_count,
         'failed': failed_count,
@@ -73,8 +284,9 @@ async def socket_emit_to_users(event: str, data: Any, user_ids: list[str]) -> di
 async def socket_emit_to_room(room: str, event: str, data: Any) -> bool:
     """Emit an event to all users in a room."""
     try:
+        await batched_emitter.flush()
         await sio.emit(event, data, room=room)
-        logger.info(f"📢 Emitted '{event}' to room '{room}'")
+        logger.info("📢 Emitted '%s' to room '%s'", event, room)
         return True
     except Exception as e:
         logger.error(f"❌ Error emitting to room '{room}': {e}")
@@ -83,6 +295,23 @@ async def socket_emit_to_room(room: str, event: str, data: Any) -> bool:
 
 # ==================== STATUS & NOTIFICATIONS ====================
 
+_status_ts_cache: tuple[int, str] = (0, "")
+
+
+def _status_timestamp() -> str:
+    """
+    UTC ISO-8601 timestamp cached per wall-clock second.
+
+    Status bursts (TTS streaming) reuse one formatted string instead of
+    running datetime formatting for every message.
+    """
+    global _status_ts_cache
+    second = int(time.time())
+    if _status_ts_cache[0] != second:
+        _status_ts_cache = (second, datetime.fromtimestamp(second, timezone.utc).isoformat())
+    return _status_ts_cache[1]
+
+
 async def emit_server_status(
     status: str,
     flag: Literal["INFO", "WARN", "ERROR"],
@@ -100,7 +329,7 @@ async def emit_server_status(
         {
             "flag": flag,
             "status": status,
-            "timestamp": datetime.now(timezone.utc).isoformat()
+            "timestamp": _status_timestamp()
         },
         user_id
     )
@@ -141,6 +370,32 @@ def get_online_count() -> int:
 
 # ==================== TTS STREAMING ====================
 
+# Bound on first use: tts_services pulls in the TTS engines (kept out of
+# this module's import for kernel-side importers) and log_stream imports
+# this module back.
+_tts_service: Any = None
+_emit_spark_log: Any = None
+
+# Strong refs to in-flight TTS streams so they aren't garbage-collected mid-stream
+_tts_stream_tasks: set[asyncio.Task] = set()
+
+
+def _get_tts_service() -> Any:
+    global _tts_service
+    if _tts_service is None:
+        from app.services.tts_services import tts_service
+        _tts_service = tts_service
+    return _tts_service
+
+
+def _get_emit_spark_log() -> Any:
+    global _emit_spark_log
+    if _emit_spark_log is None:
+        from app.socket.log_stream import emit_spark_log
+        _emit_spark_log = emit_spark_log
+    return _emit_spark_log
+
+
 async def stream_tts_to_client(
     text: str,
     user_id: Optional[str] = None,
@@ -155,8 +410,8 @@ async def stream_tts_to_client(
     How it works:
     - connected_users is a Dict[str, Set[str]]  →  { user_id: {sid1, sid2, ...} }
     - Each user can have multiple socket sessions (e.g. multiple browser tabs)
-    - If user_id is given, TTS streams only to THAT user's sessions
-    - If user_id is None, TTS broadcasts to ALL connected sessions
+    - If user_id is given, TTS streams once to THAT user's room (all sessions)
+    - If user_id is None, TTS broadcasts once to ALL connected users' rooms
     
     Args:
         text:     The text to convert to speech and stream
@@ -176,60 +431,58 @@ async def stream_tts_to_client(
         # Broadcast to everyone
         await stream_tts_to_client("Hello everyone!")
     """
-    import asyncio
-    
     if not text:
         return False
 
     try:
-        from app.services.tts_services import tts_service
-        from app.services.interrupt_manager import get_interrupt_manager
+        tts_service = _get_tts_service()
         _int = get_interrupt_manager()
 
-        # Collect target SIDs
-        target_sids: set[str] = set()
-
+        # Collect target rooms — each user's sessions share one room, so a
+        # single stream (one synthesis, one encode per chunk) reaches them all
         if user_id:
-            # Target specific user's sessions
-            target_sids = connected_users.get(user_id, set())
-            if not target_sids:
+            if not connected_users.get(user_id):
                 logger.warning(f"⚠️ User '{user_id}' not connected, falling back to print")
                 print(f"\n🔊 [TTS would say]: {text}\n")
                 return False
+            target: str | list[str] = user_room(user_id)
         else:
-            # Broadcast to all connected sessions
-            for user_sids in connected_users.values():
-                target_sids.update(user_sids)
+            # Broadcast to every connected user's room in one multi-room stream
+            target = [user_room(uid) for uid in connected_users]
 
-        if not target_sids:
+        if not target:
             logger.info("🔇 No socket clients connected (manual testing mode)")
             print(f"\n🔊 [TTS would say]: {text}\n")
             return False
 
-        # Stream TTS to each connected session (non-blocking)
-        # Also emit as spark:log so live activity shows what Spark said
+        # Stream TTS once to the target room(s) (non-blocking)
+        # Also emit as spark:log so live activity shows what Spark said —
+        # awaited inline: socket_emit only enqueues on the batched emitter
         if user_id:
-            from app.socket.log_stream import emit_spark_log
-            asyncio.create_task(emit_spark_log(user_id, "ai_response", payload={"message": text[:200]}))
+            await _get_emit_spark_log()(user_id, "ai_response", payload={"message": text[:200]})
 
-        for sid in target_sids:
-            # Skip if user was interrupted
-            if user_id and _int.is_set(user_id):
-                logger.info("⏭️ Skipping TTS stream — user %s interrupted", user_id)
-                return False
-            logger.info(f"📡 Streaming TTS to socket {sid}")
-            asyncio.create_task(
-                tts_service.stream_to_socket(
-                    sio=sio,
-                    sid=sid,
-                    text=text,
-                    gender=gender,
-                    voice=voice_name,
-                    interrupt_check=(
-                        (lambda uid=user_id: _int.is_set(uid)) if user_id else None
-                    ),
-                )
+        # Skip if user was interrupted
+        if user_id and _int.is_set(user_id):
+            logger.info("⏭️ Skipping TTS stream — user %s interrupted", user_id)
+            return False
+        logger.info("📡 Streaming TTS to %s", target)
+        # TTS chunks go straight to sio — send anything queued (e.g. the
+        # spark:log above) first so the client sees events in order
+        await batched_emitter.flush()
+        stream_task = asyncio.create_task(
+            tts_service.stream_to_socket(
+                sio=sio,
+                sid=target,
+                text=text,
+                gender=gender,
+                voice=voice_name,
+                interrupt_check=(
+                    (lambda uid=user_id: _int.is_set(uid)) if user_id else None
+                ),
             )
+        )
+        _tts_stream_tasks.add(stream_task)
+        stream_task.add_done_callback(_tts_stream_tasks.discard)
 
         return True
 
@@ -268,7 +521,17 @@ def fire_socket_event(
         from app.socket.utils import fire_socket_event
         fire_socket_event("status", {"msg": "Searching..."}, user_id="user123")
     """
-    import asyncio
+    # Fast path: enqueue on the batched emitter (no Task per event)
+    if user_id:
+        if not connected_users.get(user_id):
+            # Background jobs routinely emit to offline users — not a warning
+            logger.debug("Dropping '%s' for offline user %s", event, user_id)
+            return
+        room = user_room(user_id)
+    else:
+        room = None
+    if batched_emitter.emit_nowait(room, event, data) or batched_emitter.running:
+        return
     
     async def _safe_emit():
         try:
@@ -304,33 +567,47 @@ def fire_tts(
         from app.socket.utils import fire_tts
         fire_tts("Research complete!", user_id=user_id)
     """
-    import asyncio
-    
     if not text:
         logger.warning("⚠️ fire_tts called with empty text, skipping")
         return
     
     logger.info(f"🔊 fire_tts called: user={user_id}, text={text[:50]}...")
     
-    async def _safe_tts():
-        try:
-            result = await stream_tts_to_client(
-                text=text,
-                user_id=user_id,
-                gender=gender,
-                voice_name=voice_name,
-            )
-            if result:
-                logger.info(f"✅ fire_tts succeeded for user={user_id}")
-            else:
-                logger.warning(f"⚠️ fire_tts returned False for user={user_id} (user not connected?)")
-        except Exception as e:
-            logger.error(f"❌ fire_tts failed: {e}", exc_info=True)
+    # Offline user: take the print fallback here instead of queueing work
+    if user_id and not connected_users.get(user_id):
+        logger.debug("fire_tts: user %s offline, not queueing", user_id)
+        print(f"\n🔊 [TTS would say]: {text}\n")
+        return
+    
+    # Fast path: hand off to the single TTS worker (no Task per request)
+    if tts_dispatcher.submit(text, user_id, gender, voice_name) or tts_dispatcher.running:
+        return
     
     try:
         loop = asyncio.get_running_loop()
-        loop.create_task(_safe_tts())
+        loop.create_task(_run_tts(text, user_id, gender, voice_name))
     except RuntimeError:
         logger.warning("⚠️ No running event loop — cannot fire TTS")
         print(f"\n🔊 [TTS fallback]: {text}\n")
 
+
+async def _run_tts(
+    text: str,
+    user_id: Optional[str],
+    gender: str,
+    voice_name: Optional[str],
+) -> None:
+    """Run one fire_tts request, logging instead of raising."""
+    try:
+        result = await stream_tts_to_client(
+            text=text,
+            user_id=user_id,
+            gender=gender,
+            voice_name=voice_name,
+        )
+        if result:
+            logger.info(f"✅ fire_tts succeeded for user={user_id}")
+        else:
+            logger.warning(f"⚠️ fire_tts returned False for user={user_id} (user not connected?)")
+    except Exception as e:
+        logger.error(f"❌ fire_tts failed: {e}", exc_info=True)
@@ -43,6 +43,8 @@ def _warmup_key_cache() -> None:
     _KeyCache.get_all()
 
 
+# Sequential: populates os.environ and _KeyCache, neither of which is safe to
+# write while the concurrent warmups below may be reading provider settings.
 register("KeyCache (API keys)", _warmup_key_cache)
 
 
@@ -63,7 +65,7 @@ async def _warmup_cache_client() -> None:
         raise
 
 
-register("Cache client (LocalKV/Redis)", _warmup_cache_client)
+register("Cache client (LocalKV/Redis)", _warmup_cache_client, concurrent=True)
 
 
 # ── 3. TTS engine (Kokoro) ──
@@ -76,7 +78,7 @@ async def _warmup_tts() -> None:
     await tts_service.warmup_tts_engine()
 
 
-register("TTS engine (Kokoro)", _warmup_tts)
+register("TTS engine (Kokoro)", _warmup_tts, concurrent=True)
 
 
 # ── 4. Kernel runtime (event bus, persistence, logs) ──
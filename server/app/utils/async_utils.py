@@ -1,23 +1,59 @@
 import asyncio
 import logging
+import os
 from concurrent.futures import ThreadPoolExecutor
-from functools import wraps
-from typing import Callable, Any, TypeVar, Coroutine, ParamSpec
+from functools import partial, wraps
+from typing import Callable, Any, Optional, TypeVar, Coroutine, ParamSpec, Union, overload
 
 logger = logging.getLogger(__name__)
 
-# Create a shared thread pool for blocking operations
+
+def _executor_workers(env_var: str, default: int) -> int:
+    """Pool size from ``env_var`` if set to a valid int, else ``default``."""
+    override = os.getenv(env_var, "").strip()
+    if override:
+        try:
+            return max(1, int(override))
+        except ValueError:
+            logger.warning(f"Ignoring invalid {env_var}={override!r}")
+    return default
+
+
+# Shared thread pools for blocking operations. Threads mostly parked on
+# network/disk go to the larger I/O pool (5 per CPU, max 32). Local model
+# inference goes to a single-worker pool: calls share one model instance
+# (thread-safety not guaranteed) and each call already spreads across cores
+# internally, so running several at once only oversubscribes the host.
 _executor = ThreadPoolExecutor(
-    max_workers=4,
+    max_workers=_executor_workers("ASYNC_EXECUTOR_WORKERS", min(32, (os.cpu_count() or 1) * 5)),
     thread_name_prefix="async_wrapper"
 )
+_cpu_executor = ThreadPoolExecutor(
+    max_workers=_executor_workers("CPU_EXECUTOR_WORKERS", 1),
+    thread_name_prefix="async_cpu"
+)
 
 T = TypeVar('T')
 P = ParamSpec('P')
 
+
+async def _run_on(executor: ThreadPoolExecutor, func: Callable[..., T], args: tuple, kwargs: dict) -> T:
+    loop = asyncio.get_running_loop()
+    
+    try:
+        # run_in_executor takes no kwargs; bind them with a partial if provided
+        if kwargs:
+            return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+        return await loop.run_in_executor(executor, func, *args)
+    
+    except Exception as e:
+        logger.error(f"Error executing {func.__name__} in executor: {e}", exc_info=True)
+        raise
+
+
 async def run_in_executor(func: Callable[..., T], *args, **kwargs) -> T:
     """
-    Run a blocking/synchronous function in a thread pool executor.
+    Run a blocking/synchronous function in the shared I/O thread pool.
     
     Usage:
         result = await run_in_executor(blocking_function, arg1, arg2, key=value)
@@ -30,24 +66,38 @@ async def run_in_executor(func: Callable[..., T], *args, **kwargs) -> T:
     Returns:
         The result of the function execution
     """
-    loop = asyncio.get_event_loop()
-    
-    try:
-        # Wrap the function with kwargs if provided
-        if kwargs:
-            wrapped_func = lambda: func(*args, **kwargs)
-            result = await loop.run_in_executor(_executor, wrapped_func)
-        else:
-            result = await loop.run_in_executor(_executor, func, *args)
-        
-        return result
+    return await _run_on(_executor, func, args, kwargs)
+
+
+async def run_cpu_bound(func: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Same as ``run_in_executor`` but on the model-inference pool, which runs
+    one call at a time unless ``CPU_EXECUTOR_WORKERS`` says otherwise.
     
-    except Exception as e:
-        logger.error(f"Error executing {func.__name__} in executor: {e}", exc_info=True)
-        raise
+    Usage:
+        result = await run_cpu_bound(model.transcribe, audio)
+    """
+    return await _run_on(_cpu_executor, func, args, kwargs)
 
 
-def make_async(func: Callable[P, T]) -> Callable[P, Coroutine[Any, Any, T]]:
+@overload
+def make_async(func: Callable[P, T]) -> Callable[P, Coroutine[Any, Any, T]]: ...
+
+
+@overload
+def make_async(
+    *, cpu_bound: bool = ...
+) -> Callable[[Callable[P, T]], Callable[P, Coroutine[Any, Any, T]]]: ...
+
+
+def make_async(
+    func: Optional[Callable[P, T]] = None,
+    *,
+    cpu_bound: bool = False,
+) -> Union[
+    Callable[P, Coroutine[Any, Any, T]],
+    Callable[[Callable[P, T]], Callable[P, Coroutine[Any, Any, T]]],
+]:
     """
     Decorator to convert a synchronous function into an async function.
     
@@ -57,32 +107,42 @@ def make_async(func: Callable[P, T]) -> Callable[P, Coroutine[Any, Any, T]]:
             # blocking code
             return result
         
+        @make_async(cpu_bound=True)
+        def heavy_function(arg1):
+            # compute-heavy code, runs on the CPU pool
+            return result
+        
         # Now you can await it:
         result = await blocking_function(arg1, arg2)
     
     Args:
         func: The synchronous function to wrap
+        cpu_bound: Run on the CPU pool instead of the I/O pool
     
     Returns:
         An async version of the function
     """
-    @wraps(func)
-    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        return await run_in_executor(func, *args, **kwargs)
+    executor = _cpu_executor if cpu_bound else _executor
+    
+    def decorate(fn: Callable[P, T]) -> Callable[P, Coroutine[Any, Any, T]]:
+        @wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            return await _run_on(executor, fn, args, kwargs)
+        
+        return wrapper
     
-    return wrapper
+    return decorate(func) if func is not None else decorate
 
 
 def cleanup_executor():
     """
-    Cleanup the thread pool executor.
+    Cleanup the thread pool executors.
     Call this when shutting down your application.
     """
-    global _executor
-    if _executor:
-        logger.info("Shutting down async executor...")
-        _executor.shutdown(wait=True)
-        logger.info("Executor shutdown complete")
+    logger.info("Shutting down async executors...")
+    _executor.shutdown(wait=True)
+    _cpu_executor.shutdown(wait=True)
+    logger.info("Executor shutdown complete")
 
 
 # ── Retry helpers ─────────────────────────────────────────────────────────────
@@ -1,12 +1,18 @@
-import json
+import orjson
 import re
 import logging
+from functools import lru_cache
 from typing import Any
 from json_repair import repair_json
 from app.schemas import ActionDetails, ChatResponse, Confirmation, AnswerDetails
 
 logger = logging.getLogger(__name__)
 
+_MD_FENCE_RE = re.compile(r"^```[a-zA-Z]*\n?")
+
+# Retries and replays hand us the same raw output again; repair is the slow step
+_repair_cached = lru_cache(maxsize=256)(repair_json)
+
 def clean_ai_response(raw_data: str) -> ChatResponse:
     """Parse AI response with Hindi/English fields and robust error handling."""
     
@@ -14,30 +20,30 @@ def clean_ai_response(raw_data: str) -> ChatResponse:
         # Strip markdown wrappers
         raw_data = raw_data.strip()
         if raw_data.startswith("```"):
-            raw_data = re.sub(r"^```[a-zA-Z]*\n?", "", raw_data).rstrip("`").strip()
+            raw_data = _MD_FENCE_RE.sub("", raw_data).rstrip("`").strip()
         
         # Repair malformed JSON
         try:
-            raw_data = repair_json(raw_data)
+            raw_data = _repair_cached(raw_data)
         except Exception as e:
             logger.warning(f"JSON repair skipped: {e}")
         
         # Parse JSON
-        data: Any = json.loads(raw_data)
+        data: Any = orjson.loads(raw_data)
         
         # Handle double-encoded JSON
         if isinstance(data, str):
             logger.warning("Double-encoded JSON detected, re-parsing...")
-            data = json.loads(data)
+            data = orjson.loads(data)
         
         # Unwrap nested JSON in 'answer' field
         if "answer" in data and isinstance(data["answer"], str):
             try:
-                nested = json.loads(repair_json(data["answer"]))
+                nested = orjson.loads(_repair_cached(data["answer"]))
                 if isinstance(nested, dict) and "actionDetails" in nested:
                     logger.warning("Unwrapping nested JSON from 'answer'")
                     data = nested
-            except (json.JSONDecodeError, TypeError):
+            except (orjson.JSONDecodeError, TypeError):
                 pass
         
         # Extract required fields
@@ -78,7 +84,7 @@ def clean_ai_response(raw_data: str) -> ChatResponse:
         logger.info(f"Cleaned response: query={user_query[:30]}, action={action}, confirmed={action_details.confirmation.isConfirmed}")
         return cleaned
     
-    except (json.JSONDecodeError, AttributeError, TypeError, KeyError) as e:
+    except (orjson.JSONDecodeError, AttributeError, TypeError, KeyError) as e:
         logger.error(f"Parse failed: {e}", exc_info=True)
         logger.debug(f"Raw data: {raw_data[:500]}...")
         return _create_fallback_response(raw_data)
@@ -107,8 +113,8 @@ def _parse_action_details(data: dict) -> ActionDetails:
     )
 
 def _create_fallback_response(raw_data: str) -> ChatResponse:
-    """Create safe fallback when parsing fails."""
-    return ChatResponse(
+    """Create safe fallback when parsing fails (constant fields, built unvalidated)."""
+    return ChatResponse.model_construct(
         user_query="[Parse Error]",
         answer=raw_data.strip()[:200] if raw_data else "Response processing failed.",
         answer_english="Unable to process response.",
@@ -116,14 +122,14 @@ def _create_fallback_response(raw_data: str) -> ChatResponse:
         actionCompletedMessageEnglish="",
         action="",
         emotion="neutral",
-        answerDetails=AnswerDetails(
+        answerDetails=AnswerDetails.model_construct(
             content="", sources=[], references=[], additional_info={}
         ),
-        actionDetails=ActionDetails(
+        actionDetails=ActionDetails.model_construct(
             type="", query="", title="", artist="", topic="",
             platforms=[], app_name="", target="", location="",
             searchResults=[],
-            confirmation=Confirmation(isConfirmed=False, actionRegardingQuestion=""),
+            confirmation=Confirmation.model_construct(isConfirmed=False, actionRegardingQuestion=""),
             additional_info={}
         )
     )
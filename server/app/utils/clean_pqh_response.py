@@ -1,7 +1,8 @@
 import time  # ✅ FIXED: Changed from 'from datetime import time'
-import json
+import orjson
 import re
 import logging
+from functools import lru_cache
 from typing import Optional
 from pydantic import BaseModel, ValidationError
 from json_repair import repair_json
@@ -9,6 +10,17 @@ from app.models.pqh_response_model import PQHResponse, CognitiveState
 
 logger = logging.getLogger(__name__)
 
+_MD_FENCE_RE = re.compile(r"^```[a-zA-Z]*\n?")
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+
+# Bounded so a stream of unique payloads can't grow it without limit
+_repair_cached = lru_cache(maxsize=256)(repair_json)
+
+# Shortest possible valid PQH payload is ~66 chars, anything under this is garbage
+MIN_PQH_LENGTH = 64
+# cognitive_state is the only required key; models accept either spelling
+_COGNITIVE_STATE_KEYS = ("cognitive_state", "cognitiveState")
+
 
 # ==================== ZERO-LATENCY CLEANER ====================
 def clean_pqh_response(raw_data: str, emotion: str = "neutral") -> PQHResponse:
@@ -22,35 +34,41 @@ def clean_pqh_response(raw_data: str, emotion: str = "neutral") -> PQHResponse:
     4. Field-by-field reconstruction (last resort)
     """
     
+    # Prefilter: a blob without cognitive_state can never validate, so skip
+    # straight past the parse paths instead of paying for three failed parses
+    if len(raw_data) < MIN_PQH_LENGTH or not any(k in raw_data for k in _COGNITIVE_STATE_KEYS):
+        logger.warning("Response is not PQH-shaped, attempting manual reconstruction")
+        return _reconstruct_pqh_response(raw_data, emotion)
+    
     # Fast path: Try direct parse first (most common case)
     try:
-        data = json.loads(raw_data)
+        data = orjson.loads(raw_data)
         return PQHResponse(**data)
-    except (json.JSONDecodeError, ValidationError):
+    except (orjson.JSONDecodeError, ValidationError):
         pass
     
     # Path 2: Strip markdown wrappers
     try:
         cleaned = raw_data.strip()
         if cleaned.startswith("```"):
-            cleaned = re.sub(r"^```[a-zA-Z]*\n?", "", cleaned).rstrip("`").strip()
+            cleaned = _MD_FENCE_RE.sub("", cleaned).rstrip("`").strip()
         
-        data = json.loads(cleaned)
+        data = orjson.loads(cleaned)
         return PQHResponse(**data)
-    except (json.JSONDecodeError, ValidationError):
+    except (orjson.JSONDecodeError, ValidationError):
         pass
     
     # Path 3: JSON repair (slower but robust)
     try:
-        repaired = repair_json(raw_data.strip())
-        data = json.loads(repaired)
+        repaired = _repair_cached(raw_data.strip())
+        data = orjson.loads(repaired)
         
         # Handle double-encoded JSON
         if isinstance(data, str):
-            data = json.loads(data)
+            data = orjson.loads(data)
         
         return PQHResponse(**data)
-    except (json.JSONDecodeError, ValidationError, Exception):
+    except (orjson.JSONDecodeError, ValidationError, Exception):
         pass
     
     # Path 4: Manual reconstruction (last resort)
@@ -69,18 +87,17 @@ def _reconstruct_pqh_response(raw_data: str, emotion: str) -> PQHResponse:
         cleaned = raw_data.strip()
         
         # Remove markdown
-        cleaned = re.sub(r"^```[a-zA-Z]*\n?", "", cleaned).rstrip("`").strip()
+        cleaned = _MD_FENCE_RE.sub("", cleaned).rstrip("`").strip()
         
         # Fix common JSON errors (but NOT single quotes — they break apostrophes like "it's")
-        cleaned = re.sub(r',\s*}', '}', cleaned)  # Trailing commas
-        cleaned = re.sub(r',\s*]', ']', cleaned)  # Trailing commas in arrays
+        cleaned = _TRAILING_COMMA_RE.sub(r'\1', cleaned)  # Trailing commas in objects and arrays
         
         # Try json_repair as final attempt before regex
         try:
-            repaired = repair_json(cleaned)
-            data = json.loads(repaired)
+            repaired = _repair_cached(cleaned)
+            data = orjson.loads(repaired)
         except Exception:
-            data = json.loads(cleaned)
+            data = orjson.loads(cleaned)
         
         # ✅ FIX: Handle LLM returning a list instead of dict
         if isinstance(data, list):
@@ -130,9 +147,10 @@ def _create_error_pqh_response(raw_data: str, emotion: str) -> PQHResponse:
     
     # ✅ REMOVED: Redundant 'import time' (now using top-level import)
     
-    return PQHResponse(
+    # Every field is built here from known-good values, so skip validation
+    return PQHResponse.model_construct(
         request_id=f"error_{int(time.time()*1000)}",
-        cognitive_state=CognitiveState(
+        cognitive_state=CognitiveState.model_construct(
             user_query="[Parse Error]",
             emotion=emotion,
             thought_process="Failed to parse AI response. All validation paths exhausted.",
@@ -144,35 +162,41 @@ def _create_error_pqh_response(raw_data: str, emotion: str) -> PQHResponse:
 
 
 # ==================== QUICK VALIDATOR ====================
-def is_valid_pqh_format(raw_data: str) -> bool:
+_PQH_TOP_KEYS = ("request_id", "cognitive_state")
+_PQH_COG_KEYS = ("user_query", "emotion", "thought_process", "answer", "answer_english")
+_PQH_KEY_PROBES = tuple(f'"{k}"' for k in _PQH_TOP_KEYS + _PQH_COG_KEYS)
+
+
+def is_valid_pqh_format(raw_data: str, strict: bool = False) -> bool:
     """
     Ultra-fast format checker (< 1ms for valid responses).
     Returns True if response matches PQH format.
+    
+    By default only probes for the quoted required keys; malformed JSON
+    still gets caught by the full parse in clean_pqh_response. Pass
+    strict=True to also parse and check the key nesting.
     """
     
     try:
         # Quick string checks (fastest)
-        if not raw_data or len(raw_data) < 50:
+        if not raw_data or len(raw_data) < MIN_PQH_LENGTH:
             return False
         
-        if "request_id" not in raw_data or "cognitive_state" not in raw_data:
+        if not all(k in raw_data for k in _PQH_KEY_PROBES):
             return False
         
-        # Try direct parse (still fast)
-        data = json.loads(raw_data.strip())
+        if not strict:
+            return True
+        
+        data = orjson.loads(raw_data.strip())
         
         # Check required top-level keys
-        if not all(k in data for k in ["request_id", "cognitive_state"]):
+        if not all(k in data for k in _PQH_TOP_KEYS):
             return False
         
         # Check cognitive_state structure
         cog_state = data.get("cognitive_state", {})
-        required_cog_keys = ["user_query", "emotion", "thought_process", "answer", "answer_english"]
-        
-        if not all(k in cog_state for k in required_cog_keys):
-            return False
-        
-        return True
+        return all(k in cog_state for k in _PQH_COG_KEYS)
     
-    except (json.JSONDecodeError, TypeError, AttributeError):
-        return False
\ No newline at end of file
+    except (orjson.JSONDecodeError, TypeError, AttributeError):
+        return False
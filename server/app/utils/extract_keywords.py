@@ -1,8 +1,9 @@
 import re
-from typing import List, Optional, Set
+from functools import lru_cache
+from typing import FrozenSet, List, Optional
 
 # Comprehensive stopwords list
-STOPWORDS: Set[str] = {
+STOPWORDS: FrozenSet[str] = frozenset({
     # Articles
     'a', 'an', 'the',
     
@@ -47,8 +48,31 @@ STOPWORDS: Set[str] = {
     'this', 'that', 'these', 'those',
     'then', 'than', 'as', 'if', 'because',
     'there', 'here', 'now', 'such'
-}
+})
 
+# Technical terms to always preserve (case-insensitive check)
+_TECHNICAL_TERMS: FrozenSet[str] = frozenset({
+    'api', 'rest', 'oauth', 'jwt', 'sql', 'nosql', 'http', 'https',
+    'json', 'xml', 'html', 'css', 'js', 'jsx', 'tsx', 'npm', 'yarn',
+    'git', 'github', 'docker', 'kubernetes', 'aws', 'gcp', 'azure',
+    'react', 'vue', 'angular', 'node', 'nodejs', 'python', 'java',
+    'typescript', 'javascript', 'mongodb', 'postgresql', 'redis',
+    'graphql', 'websocket', 'grpc', 'async', 'await', 'promise',
+    'callback', 'webpack', 'babel', 'eslint', 'vite', 'nextjs',
+    'ipc', 'electron', 'django', 'flask', 'fastapi', 'express',
+    'middleware', 'cors', 'csrf', 'xss', 'ssl', 'tls', 'cdn',
+    'ci', 'cd', 'devops', 'helm', 'terraform'
+})
+
+_QUOTE_RE = re.compile(r'"([^"]+)"')
+# Runs of word chars/hyphens: the same tokens as replacing everything else
+# with spaces and splitting, in one scan
+_TOKEN_RE = re.compile(r'[\w-]+')
+_CLEAN_WORD_RE = re.compile(r'[^\w-]')
+# Sentence punctuation trimmed off a preserved technical term ("JavaScript?")
+_EDGE_PUNCTUATION = '.,;:!?"\'()[]{}'
+
+@lru_cache(maxsize=2048)
 def extract_keywords(text: str, min_word_length: int = 2, preserve_phrases: bool = False) -> str:
     """
     Extract keywords from text by removing stopwords and common filler words.
@@ -79,20 +103,16 @@ def extract_keywords(text: str, min_word_length: int = 2, preserve_phrases: bool
     preserved_phrases = []
     if preserve_phrases:
         # Extract content within quotes
-        quote_pattern = r'"([^"]+)"'
-        preserved_phrases = re.findall(quote_pattern, text)
+        preserved_phrases = _QUOTE_RE.findall(text)
         # Remove quotes from original text
-        text = re.sub(quote_pattern, '', text)
+        text = _QUOTE_RE.sub('', text)
     
     # Convert to lowercase
     text = text.lower()
     
-    # Remove special characters but keep alphanumeric and spaces
+    # Split into words, dropping special characters
     # Keep hyphens for compound words (e.g., "machine-learning")
-    text = re.sub(r'[^\w\s-]', ' ', text)
-    
-    # Split into words
-    words = text.split()
+    words = _TOKEN_RE.findall(text)
     
     # Filter: remove stopwords and short words
     keywords = [
@@ -110,6 +130,7 @@ def extract_keywords(text: str, min_word_length: int = 2, preserve_phrases: bool
     return ' '.join(keywords)
 
 
+@lru_cache(maxsize=2048)
 def extract_keywords_advanced(
     text: str, 
     min_word_length: int = 2,
@@ -129,58 +150,38 @@ def extract_keywords_advanced(
         Cleaned keyword string
     
     Examples:
-        >>> extract_keywords_advanced("How to implement OAuth2 authentication?")
-        "implement OAuth2 authentication"
+        >>> extract_keywords_advanced("I want to build a REST API with Node.js")
+        "want build REST API Node.js"
         
         >>> extract_keywords_advanced("Best practices for async/await in JavaScript", max_keywords=3)
-        "practices async/await JavaScript"
+        "best practices async"
     """
     if not text or not text.strip():
         return ""
     
-    # Technical terms to always preserve (case-insensitive check)
-    technical_terms = {
-        'api', 'rest', 'oauth', 'jwt', 'sql', 'nosql', 'http', 'https',
-        'json', 'xml', 'html', 'css', 'js', 'jsx', 'tsx', 'npm', 'yarn',
-        'git', 'github', 'docker', 'kubernetes', 'aws', 'gcp', 'azure',
-        'react', 'vue', 'angular', 'node', 'nodejs', 'python', 'java',
-        'typescript', 'javascript', 'mongodb', 'postgresql', 'redis',
-        'graphql', 'websocket', 'grpc', 'async', 'await', 'promise',
-        'callback', 'webpack', 'babel', 'eslint', 'vite', 'nextjs',
-        'ipc', 'electron', 'django', 'flask', 'fastapi', 'express',
-        'middleware', 'cors', 'csrf', 'xss', 'ssl', 'tls', 'cdn',
-        'ci', 'cd', 'devops', 'kubernetes', 'helm', 'terraform'
-    }
-    
-    original_text = text
-    text_lower = text.lower()
-    
-    # Extract technical terms first (preserve case)
-    preserved_technical = []
-    if keep_technical_terms:
-        words_original = original_text.split()
-        for i, word in enumerate(words_original):
-            word_clean = re.sub(r'[^\w-]', '', word.lower())
-            if word_clean in technical_terms:
-                preserved_technical.append((i, word))  # Store position and original case
-    
-    # Standard keyword extraction
-    text_lower = re.sub(r'[^\w\s-]', ' ', text_lower)
-    words = text_lower.split()
-    
-    # Filter stopwords
+    # Single pass over the whitespace tokens: a technical term keeps its
+    # original casing, anything else is split on punctuation and filtered
     keywords = []
-    for i, word in enumerate(words):
-        # Check if this position has a technical term
-        tech_word = next((tw[1] for tw in preserved_technical if tw[0] == i), None)
-        if tech_word:
-            keywords.append(tech_word)  # Use original case
-        elif word not in STOPWORDS and len(word) >= min_word_length:
-            keywords.append(word)
-    
-    # Limit keywords if specified
-    if max_keywords and len(keywords) > max_keywords:
-        keywords = keywords[:max_keywords]
+    # Falsy max_keywords (None or 0) means unlimited, as before
+    limit = max_keywords or None
+    # Lowercasing never touches whitespace, so both splits line up
+    for word, word_lower in zip(text.split(), text.lower().split()):
+        # Most words are already clean: isalnum() is one C scan accepting
+        # exactly the chars \w matches (bar '_'), so regexes only run on the rest
+        plain = word_lower.isalnum()
+        if keep_technical_terms and (
+            word_lower if plain else _CLEAN_WORD_RE.sub('', word_lower)
+        ) in _TECHNICAL_TERMS:
+            keywords.append(word.strip(_EDGE_PUNCTUATION))  # Use original case
+        else:
+            for part in (word_lower,) if plain else _TOKEN_RE.findall(word_lower):
+                if part not in STOPWORDS and len(part) >= min_word_length:
+                    keywords.append(part)
+                    if len(keywords) == limit:
+                        break
+        # Stop scanning once the keyword limit is reached
+        if len(keywords) == limit:
+            break
     
     return ' '.join(keywords)
 
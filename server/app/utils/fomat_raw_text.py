@@ -1,5 +1,9 @@
 import re
 
+_TRIPLE_NL = re.compile(r'\n{3,}')
+_BULLET = re.compile(r"^[-*•\dA-Za-z]+\.")
+_INNER_NL = re.compile(r'\s*\n\s*')
+
 def format_raw_text(text: str):
     """
     Cleans and formats raw string content into readable multiline text.
@@ -8,11 +12,15 @@ def format_raw_text(text: str):
     - Removes unwanted escape sequences like \\n or extra spaces.
     """
 
+    # Single-line text with no escaped newlines has nothing to reflow
+    if "\n" not in text and "\\n" not in text:
+        return text.strip()
+
     # 1️⃣ Unescape any literal "\n" and trim spaces
     text = text.replace("\\n", "\n").strip()
 
     # 2️⃣ Normalize spacing (remove extra newlines >2)
-    text = re.sub(r'\n{3,}', '\n\n', text)
+    text = _TRIPLE_NL.sub('\n\n', text)
 
     # 3️⃣ Split into paragraphs by double newlines
     paragraphs = [p.strip() for p in text.split("\n\n") if p.strip()]
@@ -21,11 +29,11 @@ def format_raw_text(text: str):
 
     for para in paragraphs:
         # Detect bullet-like structure
-        if re.match(r"^[-*•\dA-Za-z]+\.", para.strip()):
+        if _BULLET.match(para):
             formatted.append(para)  # already structured, leave as is
         else:
             # Clean single newlines inside poetic lines, but keep flow
-            para = re.sub(r'\s*\n\s*', '\n', para)
+            para = _INNER_NL.sub('\n', para)
             formatted.append(para)
 
     # 4️⃣ Join paragraphs with double newlines
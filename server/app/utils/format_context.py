@@ -1,9 +1,14 @@
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timezone, timedelta
-from zoneinfo import ZoneInfo
+from functools import lru_cache
 
 NEPAL_TZ = timezone(timedelta(hours=5, minutes=45))
 
+# Relative-age thresholds, in seconds
+_MINUTE = 60
+_HOUR = 3600
+_DAY = 86400
+
 
 def _coerce_score(value: object) -> float:
     try:
@@ -11,10 +16,62 @@ def _coerce_score(value: object) -> float:
     except (TypeError, ValueError):
         return 0.0
 
-def format_context(recent_context: List[Dict], query_based_context: List[Dict]) -> Tuple[str, str]:
-    """Format context data for prompt injection with timestamps and relative time."""
+@lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: object) -> Optional[Tuple[datetime, str]]:
+    """Parse a context timestamp into (Nepal datetime, display label), or None.
+
+    Memoised: the same Redis/LanceDB entries come back prompt after prompt,
+    and parse + strftime is the bulk of the per-row cost. The relative age
+    depends on "now" so it is never cached.
+    """
+    try:
+        if isinstance(timestamp, str):
+            # 3.11+ fromisoformat (C-implemented) accepts a trailing 'Z' itself
+            dt_utc = datetime.fromisoformat(timestamp)
+        else:
+            dt_utc = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        dt_nepal = dt_utc.astimezone(NEPAL_TZ)
+        return dt_nepal, dt_nepal.strftime('%b %d, %I:%M %p')
+    except Exception:
+        return None
+
+def _format_timestamp(timestamp: object, now_nepal: datetime) -> Tuple[str, str]:
+    """Return (Nepal-time label, relative age) for a context timestamp."""
+    if not timestamp:
+        return "", ""
+    try:
+        parsed = _parse_timestamp(timestamp)
+    except TypeError:  # unhashable, so it can't be a timestamp either
+        parsed = None
+    if parsed is None:
+        return "Unknown time", ""
+    dt_nepal, time_str = parsed
+    try:
+        secs = (now_nepal - dt_nepal).total_seconds()
+    except TypeError:  # naive "now" passed in
+        return "Unknown time", ""
+    
+    if secs < _MINUTE:
+        return time_str, "just now"
+    if secs < _HOUR:
+        return time_str, f"{int(secs // _MINUTE)}m ago"
+    if secs < _DAY:
+        return time_str, f"{int(secs // _HOUR)}h ago"
+    return time_str, f"{int(secs // _DAY)}d ago"
+
+def format_context(
+    recent_context: List[Dict],
+    query_based_context: List[Dict],
+    *,
+    now: Optional[datetime] = None,
+) -> Tuple[str, str]:
+    """Format context data for prompt injection with timestamps and relative time.
+
+    ``now`` (timezone-aware) lets callers assembling several prompts in a row
+    share one clock reading; defaults to the current Nepal time.
+    """
     
-    now_nepal = datetime.now(NEPAL_TZ)
+    now_nepal = now or datetime.now(NEPAL_TZ)
     
     # ---------------- Recent conversation ----------------
     if recent_context:
@@ -24,37 +81,7 @@ def format_context(recent_context: List[Dict], query_based_context: List[Dict])
             timestamp = ctx.get('timestamp', '')
             role = ctx.get('role', '')
             
-            time_str = ""
-            relative_time = ""
-            
-            if timestamp:
-                try:
-                    if isinstance(timestamp, str):
-                        dt_utc = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        dt_nepal = dt_utc.astimezone(NEPAL_TZ)
-                    else:
-                        dt_utc = datetime.fromtimestamp(timestamp, tz=ZoneInfo("UTC"))
-                        dt_nepal = dt_utc.astimezone(NEPAL_TZ)
-                    
-                    time_str = dt_nepal.strftime('%b %d, %I:%M %p')
-                    
-                    time_diff = now_nepal - dt_nepal
-                    minutes = int(time_diff.total_seconds() / 60)
-                    
-                    if minutes < 1:
-                        relative_time = "just now"
-                    elif minutes < 60:
-                        relative_time = f"{minutes}m ago"
-                    elif minutes < 1440:
-                        hours = minutes // 60
-                        relative_time = f"{hours}h ago"
-                    else:
-                        days = minutes // 1440
-                        relative_time = f"{days}d ago"
-                        
-                except Exception:
-                    time_str = "Unknown time"
-                    relative_time = ""
+            time_str, relative_time = _format_timestamp(timestamp, now_nepal)
             
             if relative_time:
                 recent_formatted.append(f"[{time_str}] {content} ({relative_time}) - {role}")
@@ -80,38 +107,7 @@ def format_context(recent_context: List[Dict], query_based_context: List[Dict])
             )
             timestamp = ctx.get('timestamp', '')
             
-            
-            time_str = ""
-            relative_time = ""
-            
-            if timestamp:
-                try:
-                    if isinstance(timestamp, str):
-                        dt_utc = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                        dt_nepal = dt_utc.astimezone(NEPAL_TZ)
-                    else:
-                        dt_utc = datetime.fromtimestamp(timestamp, tz=ZoneInfo("UTC"))
-                        dt_nepal = dt_utc.astimezone(NEPAL_TZ)
-                    
-                    time_str = dt_nepal.strftime('%b %d, %I:%M %p')
-                    
-                    time_diff = now_nepal - dt_nepal
-                    minutes = int(time_diff.total_seconds() / 60)
-                    
-                    if minutes < 1:
-                        relative_time = "just now"
-                    elif minutes < 60:
-                        relative_time = f"{minutes}m ago"
-                    elif minutes < 1440:
-                        hours = minutes // 60
-                        relative_time = f"{hours}h ago"
-                    else:
-                        days = minutes // 1440
-                        relative_time = f"{days}d ago"
-                        
-                except Exception:
-                    time_str = "Unknown time"
-                    relative_time = ""
+            time_str, relative_time = _format_timestamp(timestamp, now_nepal)
             
             if relative_time:
                 query_formatted.append(f"[{time_str}] {query} ({relative_time}) [rel:{relevance:.2f}]")
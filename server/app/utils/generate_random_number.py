@@ -1,5 +1,11 @@
 import secrets
 
 def generate_otp(length: int = 6) -> str:
-    """Generate a cryptographically secure OTP."""
-    return ''.join(secrets.choice('0123456789') for _ in range(length))
\ No newline at end of file
+    """Generate a cryptographically secure OTP.
+
+    One uniform draw over [0, 10**length), zero-padded. randbelow
+    rejection-samples, so every digit string is equally likely.
+    """
+    if length <= 0:
+        return ""
+    return f"{secrets.randbelow(10 ** length):0{length}d}"
\ No newline at end of file
@@ -1,7 +1,32 @@
 from datetime import datetime
 from typing import Any
+import orjson
 from bson import ObjectId
 
+# Plain JSON scalars skip the conversion checks entirely
+_PASSTHROUGH_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _convert_scalar(value: Any) -> Any:
+    """Mongo/BSON scalar -> JSON-friendly value (unknown types returned as-is)."""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, bytes):
+        # Handle binary data if needed
+        return value.decode('utf-8', errors='ignore')
+    return value
+
+
+def _convert_value(value: Any) -> Any:
+    if type(value) in _PASSTHROUGH_TYPES:
+        return value
+    if isinstance(value, (dict, list)):
+        return serialize_doc(value)
+    return _convert_scalar(value)
+
+
 def serialize_doc(doc: Any) -> Any:
     """
     Recursively convert MongoDB document or list of documents
@@ -17,27 +42,26 @@ def serialize_doc(doc: Any) -> Any:
         return [serialize_doc(item) for item in doc]
     
     if isinstance(doc, dict):
-        serialized = {}
-        for key, value in doc.items():
-            if isinstance(value, ObjectId):
-                serialized[key] = str(value)
-            elif isinstance(value, datetime):
-                serialized[key] = value.isoformat()
-            elif isinstance(value, (dict, list)):
-                serialized[key] = serialize_doc(value)
-            elif isinstance(value, bytes):
-                # Handle binary data if needed
-                serialized[key] = value.decode('utf-8', errors='ignore')
-            else:
-                serialized[key] = value
-        return serialized
+        return {key: _convert_value(value) for key, value in doc.items()}
     
     # Handle standalone ObjectId or datetime
-    if isinstance(doc, ObjectId):
-        return str(doc)
-    
-    if isinstance(doc, datetime):
-        return doc.isoformat()
-    
-    # Return as-is for primitives (str, int, float, bool, etc.)
-    return doc
\ No newline at end of file
+    return _convert_scalar(doc)
+
+
+def _orjson_default(value: Any) -> Any:
+    converted = _convert_scalar(value)
+    if converted is value:
+        raise TypeError
+    return converted
+
+
+def serialize_doc_fast(doc: Any) -> bytes:
+    """
+    Serialize a MongoDB document (or list of them) straight to JSON bytes.
+
+    Same conversions as ``serialize_doc`` but the traversal happens inside
+    orjson; use it where the result goes on the wire rather than being
+    read or mutated as a dict. Naive datetimes stay naive, matching
+    ``serialize_doc``'s ``isoformat()`` output.
+    """
+    return orjson.dumps(doc, default=_orjson_default)
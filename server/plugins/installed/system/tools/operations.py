@@ -11,6 +11,7 @@ import re
 import shutil
 import subprocess
 import sys
+from collections import deque
 from pathlib import Path
 from typing import Dict, Any
 from datetime import datetime
@@ -20,8 +21,17 @@ from app.path.manager import PathManager
 from shared.path_resolver import get_path_resolver
 
 
+# Home resolved once so "~" paths don't re-read the environment per call
+_HOME = os.path.expanduser("~")
+
+
 def _expand_path(path: str) -> str:
-    return os.path.abspath(os.path.expanduser(path))
+    """Absolute path with a leading ``~``/``~/`` expanded against the cached home."""
+    if path.startswith("~") and (len(path) == 1 or path[1] in ("/", os.sep)):
+        path = _HOME + path[1:]
+    else:
+        path = os.path.expanduser(path)  # no-op unless ~otheruser
+    return os.path.abspath(path)
 
 
 def _notify_shell_change(path: str) -> None:
@@ -276,7 +286,7 @@ class FileCreateTool(BaseTool):
             if base_name.endswith(".") or (base_name and "." not in base_name):
                 requested_path = requested_path.rstrip(".") + ".txt"
 
-            expanded_path = os.path.expanduser(requested_path)
+            expanded_path = _expand_path(requested_path)
             resolved_path = os.path.abspath(expanded_path)
 
             # Redirect ambiguous paths and any target inside the server tree
@@ -290,7 +300,7 @@ class FileCreateTool(BaseTool):
                     "Redirected '%s' -> '%s' (artifact store)", path, resolved_path
                 )
 
-            if os.path.exists(resolved_path) and not overwrite:
+            if not overwrite and os.path.exists(resolved_path):
                 return ToolOutput(
                     success=False, data={},
                     error=f"File already exists: {resolved_path}"
@@ -302,8 +312,8 @@ class FileCreateTool(BaseTool):
 
             with open(resolved_path, 'w', encoding='utf-8') as f:
                 f.write(content)
-
-            file_stat = os.stat(resolved_path)
+                f.flush()
+                file_stat = os.fstat(f.fileno())
 
             # Register as artifact for later retrieval
             from app.path.artifacts import get_artifact_store
@@ -388,7 +398,7 @@ class FolderCreateTool(BaseTool):
             return ToolOutput(success=False, data={}, error="Path is required")
 
         try:
-            expanded_path = os.path.expanduser(path)
+            expanded_path = _expand_path(path)
 
             if recursive:
                 os.makedirs(expanded_path, exist_ok=True)
@@ -407,7 +417,8 @@ class FolderCreateTool(BaseTool):
                     "folder_name": os.path.basename(expanded_path),
                     "absolute_path": expanded_path,
                     "created_at": datetime.now().isoformat(),
-                    "exists": os.path.exists(expanded_path)
+                    # makedirs/mkdir either created it or raised
+                    "exists": True
                 }
             )
 
@@ -443,16 +454,19 @@ class FileCopyTool(BaseTool):
             )
 
         try:
-            source_path = os.path.expanduser(source)
-            dest_path = os.path.expanduser(destination)
+            source_path = _expand_path(source)
+            dest_path = _expand_path(destination)
 
-            if not os.path.exists(source_path):
+            # One stat for existence + size (the copy has the source's size)
+            try:
+                file_stat = os.stat(source_path)
+            except FileNotFoundError:
                 return ToolOutput(
                     success=False, data={},
                     error=f"Source file not found: {source}"
                 )
 
-            if os.path.exists(dest_path) and not overwrite:
+            if not overwrite and os.path.exists(dest_path):
                 return ToolOutput(
                     success=False, data={},
                     error=f"Destination already exists: {destination}"
@@ -464,8 +478,6 @@ class FileCopyTool(BaseTool):
 
             shutil.copy2(source_path, dest_path)
 
-            file_stat = os.stat(dest_path)
-
             self.logger.info(f"Copied: {source} -> {destination}")
 
             return ToolOutput(
@@ -507,7 +519,7 @@ class FileSearchTool(BaseTool):
             return ToolOutput(success=False, data={}, error="Query is required")
 
         try:
-            expanded_path = os.path.expanduser(search_path)
+            expanded_path = _expand_path(search_path)
 
             if not os.path.exists(expanded_path):
                 return ToolOutput(
@@ -520,15 +532,31 @@ class FileSearchTool(BaseTool):
             results = []
             query_lower = query.lower()
 
-            for root, dirs, files in os.walk(expanded_path):
-                for file in files:
-                    if query_lower in file.lower():
-                        full_path = os.path.join(root, file)
-                        file_stat = os.stat(full_path)
+            # scandir BFS: each DirEntry carries name/type from the directory
+            # read, so only matches cost a stat, and listing stops at max_results
+            pending = deque([expanded_path])
+            while pending and len(results) < max_results:
+                try:
+                    entries = os.scandir(pending.popleft())
+                except OSError:
+                    continue  # unreadable directory — skipped, as os.walk did
+                with entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir():
+                                # Symlinked dirs are not descended into (os.walk default)
+                                if not entry.is_symlink():
+                                    pending.append(entry.path)
+                                continue
+                            if query_lower not in entry.name.lower():
+                                continue
+                            file_stat = entry.stat()
+                        except OSError:
+                            continue
 
                         results.append({
-                            "filename": file,
-                            "path": full_path,
+                            "filename": entry.name,
+                            "path": entry.path,
                             "size_bytes": file_stat.st_size,
                             "modified_at": datetime.fromtimestamp(file_stat.st_mtime).isoformat()
                         })
@@ -536,9 +564,6 @@ class FileSearchTool(BaseTool):
                         if len(results) >= max_results:
                             break
 
-                if len(results) >= max_results:
-                    break
-
             self.logger.info(f"Found {len(results)} files")
 
             return ToolOutput(
@@ -579,7 +604,7 @@ class FileReadTool(BaseTool):
             return ToolOutput(success=False, data={}, error="Path is required")
 
         try:
-            expanded_path = os.path.expanduser(path)
+            expanded_path = _expand_path(path)
 
             if not os.path.exists(expanded_path):
                 return ToolOutput(
@@ -33,13 +33,15 @@ Matches tool_registry.json:
 }
 """
 
-import asyncio
 import re
+import threading
+import time
 from typing import Dict, Any, List
 from datetime import datetime
 from urllib.parse import urlparse
 
 from app.plugins.tools.tool_base import BaseTool, ToolOutput
+from app.utils.async_utils import run_in_executor
 from ddgs import DDGS
 
 
@@ -54,6 +56,8 @@ BLOCKED_DOMAINS = {
     "pinterest.com", "tumblr.com",                 # image boards, rarely useful
     "slideshare.net",                              # presentations, low snippet quality
 }
+# One alternation scan per result instead of a substring test per domain
+BLOCKED_DOMAIN_PATTERN = re.compile("|".join(re.escape(d) for d in sorted(BLOCKED_DOMAINS)))
 
 # Domains whose results get a score bonus — ordered by tier
 TRUSTED_DOMAINS: Dict[str, float] = {
@@ -93,6 +97,11 @@ SPAM_PATTERNS = re.compile(
     re.IGNORECASE,
 )
 
+# Arabic/Hebrew, CJK ideographs and kana — any hit marks the text non-English
+NON_LATIN_SCRIPT_PATTERN = re.compile(r"[؀-ۿ一-鿿぀-ヿ]")
+WORD_PATTERN = re.compile(r"\w+")
+LATIN_WORD_PATTERN = re.compile(r"[a-zA-Z]{3,}")
+
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
@@ -132,8 +141,8 @@ def _relevance_score(query: str, title: str, snippet: str, url: str) -> float:
     * domain trust      — bonus for authoritative domains
     * spam penalty      — deduct for clickbait patterns
     """
-    query_words = set(re.findall(r"\w+", query.lower()))
-    title_words  = set(re.findall(r"\w+", title.lower()))
+    query_words = set(WORD_PATTERN.findall(query.lower()))
+    title_words  = set(WORD_PATTERN.findall(title.lower()))
     snippet_text = snippet.lower()
 
     # 1. Keyword hits in title (weighted 2×) and snippet
@@ -160,7 +169,8 @@ def _relevance_score(query: str, title: str, snippet: str, url: str) -> float:
 
 def _is_english(text: str) -> bool:
     """Reject text that contains CJK or Arabic/Hebrew script."""
-    return not re.search(r"[؀-ۿ一-鿿぀-ヿ]", text)
+    # Most results are pure ASCII; only run the script regex on the rest
+    return text.isascii() or NON_LATIN_SCRIPT_PATTERN.search(text) is None
 
 
 def _is_quality_snippet(snippet: str, min_length: int = 40) -> bool:
@@ -168,10 +178,28 @@ def _is_quality_snippet(snippet: str, min_length: int = 40) -> bool:
     if len(snippet.strip()) < min_length:
         return False
     # Must contain at least a few real words
-    words = re.findall(r"[a-zA-Z]{3,}", snippet)
+    words = LATIN_WORD_PATTERN.findall(snippet)
     return len(words) >= 5
 
 
+_ddgs_local = threading.local()
+
+
+def _thread_ddgs() -> DDGS:
+    """
+    One long-lived DDGS client per worker thread.
+
+    DDGS caches its engine instances (and their HTTP sessions) on itself,
+    so reusing it keeps connections and TLS state warm between searches.
+    Per-thread rather than shared because engine state isn't documented
+    as thread-safe, and searches run concurrently on the executor.
+    """
+    client = getattr(_ddgs_local, "client", None)
+    if client is None:
+        client = _ddgs_local.client = DDGS()
+    return client
+
+
 def _favicon_urls(url: str) -> Dict[str, str]:
     """
     Return favicon URLs for a given page URL — zero extra HTTP calls.
@@ -255,21 +283,19 @@ class WebSearchTool(BaseTool):
         query = inputs.get("query", "").strip()
         max_results = int(inputs.get("max_results", 10))
 
-        print("inputs: inside search.py", inputs)
-
         if not query:
             return ToolOutput(success=False, data={}, error="Query is required")
 
-        self.logger.info(f"Searching: '{query}' (max: {max_results})")
+        self.logger.debug("Searching: '%s' (max: %d)", query, max_results)
 
-        t0 = datetime.now()
+        t0 = time.perf_counter_ns()
         results = await self._fetch_and_rank(query, max_results)
 
         # Retry with a broader query if we got very few results
         if len(results) < max(1, max_results // 2):
             broad_query = self._broaden_query(query)
             if broad_query != query:
-                self.logger.info(f"Too few results; retrying with: '{broad_query}'")
+                self.logger.debug("Too few results; retrying with: '%s'", broad_query)
                 extra = await self._fetch_and_rank(broad_query, max_results)
                 # Merge, deduplicate by URL
                 seen_urls = {r["url"] for r in results}
@@ -279,7 +305,7 @@ class WebSearchTool(BaseTool):
                         seen_urls.add(r["url"])
                 results = results[:max_results]
 
-        search_time_ms = (datetime.now() - t0).total_seconds() * 1000
+        search_time_ms = (time.perf_counter_ns() - t0) / 1_000_000
 
         return ToolOutput(
             success=True,
@@ -296,8 +322,8 @@ class WebSearchTool(BaseTool):
 
     async def _fetch_and_rank(self, query: str, limit: int) -> List[Dict[str, Any]]:
         """Fetch candidates from DDGS, filter, score, and return top `limit`."""
-        candidates = await asyncio.get_event_loop().run_in_executor(
-            None, self._ddgs_search, query, limit * 5   # over-fetch for filtering
+        candidates = await run_in_executor(
+            self._ddgs_search, query, limit * 5   # over-fetch for filtering
         )
 
         scored: List[tuple[float, Dict]] = []
@@ -312,7 +338,7 @@ class WebSearchTool(BaseTool):
             # ── Hard filters ──────────────────────────────────────
             if not url.startswith("http"):
                 continue
-            if any(blocked in domain for blocked in BLOCKED_DOMAINS):
+            if BLOCKED_DOMAIN_PATTERN.search(domain):
                 continue
             if not _is_english(title + snippet):
                 continue
@@ -344,18 +370,17 @@ class WebSearchTool(BaseTool):
         """Synchronous DuckDuckGo fetch (runs in executor thread)."""
         raw: List[Dict[str, Any]] = []
         try:
-            with DDGS() as ddgs:
-                for r in ddgs.text(
-                    query,
-                    max_results=fetch_limit,
-                    region="us-en",
-                    safesearch="moderate",  # was "low" — raised to cut spam
-                ):
-                    raw.append({
-                        "title":   r.get("title", ""),
-                        "url":     r.get("href", ""),
-                        "snippet": r.get("body", ""),
-                    })
+            for r in _thread_ddgs().text(
+                query,
+                max_results=fetch_limit,
+                region="us-en",
+                safesearch="moderate",  # was "low" — raised to cut spam
+            ):
+                raw.append({
+                    "title":   r.get("title", ""),
+                    "url":     r.get("href", ""),
+                    "snippet": r.get("body", ""),
+                })
         except Exception as exc:
             self.logger.warning(f"DDGS error: {exc}")
         return raw
@@ -10,7 +10,9 @@ Key settings for JSON output:
 """
 
 import requests
+import httpx
 import json
+import orjson
 import sys
 
 from app.registry.tool_index import get_tools_index
@@ -92,30 +94,34 @@ def get_streaming_response(prompt: str, system_prompt: str | None = None):
     }
 
     try:
-        with requests.post(API_URL, json=payload, stream=True) as response:
+        with httpx.stream("POST", API_URL, json=payload, timeout=None) as response:
             response.raise_for_status()
 
             full_response = ""
-            for line in response.iter_lines():
-                if line:
-                    decoded_line = line.decode('utf-8')
-                    
-                    if decoded_line.startswith('data: '):
-                        data_str = decoded_line[6:]
-                        
-                        if data_str.strip() == "[DONE]":
-                            break
-                        
-                        try:
-                            data = json.loads(data_str)
-                            chunk = data.get("response", "")
-                            full_response += chunk
-                            print(chunk, end="", flush=True)
-                        except json.JSONDecodeError:
-                            continue
-                            
+            buffer = b""
+            done = False
+            for raw in response.iter_bytes(chunk_size=4096):
+                # Events end on a blank line; keep the partial tail for the next read
+                buffer = (buffer + raw).replace(b"\r\n", b"\n")
+                *events, buffer = buffer.split(b"\n\n")
+                for event in events:
+                    if not event.startswith(b"data: "):
+                        continue
+                    data_bytes = event[6:]
+                    if data_bytes.strip() == b"[DONE]":
+                        done = True
+                        break
+                    try:
+                        chunk = orjson.loads(data_bytes).get("response", "")
+                    except orjson.JSONDecodeError:
+                        continue
+                    full_response += chunk
+                    print(chunk, end="", flush=True)
+                if done:
+                    break
+
             print("\n" + "-" * 50)
-            
+
             # Try to parse the full response as JSON
             try:
                 parsed = json.loads(full_response)
@@ -125,7 +131,7 @@ def get_streaming_response(prompt: str, system_prompt: str | None = None):
                 print("⚠️ Response was not valid JSON")
                 return full_response
 
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print(f"\n❌ Could not connect to {API_URL}")
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -0,0 +1,43 @@
+import unittest
+
+try:
+    from app.kernel.execution.execution_models import ExecutionState, Task, TaskRecord
+    _IMPORT_ERROR = None
+except Exception as exc:  # pragma: no cover - environment-dependent import gate
+    ExecutionState = None  # type: ignore[assignment]
+    Task = None  # type: ignore[assignment]
+    TaskRecord = None  # type: ignore[assignment]
+    _IMPORT_ERROR = exc
+
+
+def _record(task_id: str, status: str = "pending") -> "TaskRecord":
+    return TaskRecord(
+        task=Task(task_id=task_id, tool="open_app", execution_target="client"),
+        status=status,
+    )
+
+
+@unittest.skipIf(_IMPORT_ERROR is not None, f"Execution model imports unavailable: {_IMPORT_ERROR}")
+class ExecutionStateCompletedIdsTests(unittest.TestCase):
+    def test_add_task_tracks_completed_records(self):
+        state = ExecutionState(user_id="u1")
+        state.add_task(_record("t1", status="completed"))
+        state.add_task(_record("t2"))
+
+        self.assertEqual(state.completed_task_ids, {"t1"})
+
+    def test_status_transitions_update_completed_set(self):
+        state = ExecutionState(user_id="u1")
+        state.add_task(_record("t1"))
+        state.add_task(_record("t2"))
+
+        state.update_task_status("t2", "completed")
+        state.update_task_status("t1", "completed")
+        self.assertEqual(state.get_completed_task_ids(), ["t1", "t2"])
+
+        state.update_task_status("t1", "pending")
+        self.assertEqual(state.completed_task_ids, {"t2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import json
+import unittest
+
+try:
+    from app.kernel.execution.execution_models import Task, TaskBatchWire, TaskRecord
+    _IMPORT_ERROR = None
+except Exception as exc:  # pragma: no cover - environment-dependent import gate
+    Task = None  # type: ignore[assignment]
+    TaskBatchWire = None  # type: ignore[assignment]
+    TaskRecord = None  # type: ignore[assignment]
+    _IMPORT_ERROR = exc
+
+
+def _record(task_id: str = "t1") -> "TaskRecord":
+    return TaskRecord(
+        task=Task(task_id=task_id, tool="open_app", execution_target="client"),
+    )
+
+
+@unittest.skipIf(_IMPORT_ERROR is not None, f"Execution model imports unavailable: {_IMPORT_ERROR}")
+class TaskBatchWireTests(unittest.TestCase):
+    def test_columns_rebuild_original_rows(self):
+        records = [_record("t1"), _record("t2")]
+        records[1].status = "emitted"
+
+        wire = TaskBatchWire.from_records(records, {"t2": ["t1"]})
+        columns = json.loads(wire.model_dump_json())
+
+        rows = [
+            {name: column[i] for name, column in columns.items()}
+            for i in range(len(records))
+        ]
+        for row, record in zip(rows, records):
+            completed = row.pop("server_completed_dependencies")
+            self.assertEqual(row, record.model_dump(mode="json"))
+            self.assertEqual(completed, ["t1"] if record.task_id == "t2" else [])
+
+    def test_completed_column_left_empty_without_completions(self):
+        wire = TaskBatchWire.from_records([_record("t1"), _record("t2")], {})
+
+        self.assertEqual(wire.server_completed_dependencies, [])
+        self.assertEqual(len(wire.task), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SERVER_ROOT = Path(__file__).resolve().parents[1]
+if str(SERVER_ROOT) not in sys.path:
+    sys.path.insert(0, str(SERVER_ROOT))
+
+from app import auto_initializer
+
+
+class AutoInitializerTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch.object(auto_initializer, "_registry", [])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_concurrent_initializers_overlap(self) -> None:
+        events: list[str] = []
+        gate = asyncio.Event()
+
+        async def first() -> None:
+            events.append("first:start")
+            await gate.wait()
+            events.append("first:end")
+
+        async def second() -> None:
+            events.append("second:start")
+            gate.set()
+
+        auto_initializer.register("first", first, concurrent=True)
+        auto_initializer.register("second", second, concurrent=True)
+
+        await asyncio.wait_for(auto_initializer.run_all(), timeout=1)
+
+        self.assertEqual(events, ["first:start", "second:start", "first:end"])
+
+    async def test_sequential_initializer_waits_for_concurrent_group(self) -> None:
+        events: list[str] = []
+
+        async def warmup() -> None:
+            await asyncio.sleep(0.01)
+            events.append("warmup")
+
+        def dependent() -> None:
+            events.append("dependent")
+
+        auto_initializer.register("warmup", warmup, concurrent=True)
+        auto_initializer.register("dependent", dependent)
+
+        await auto_initializer.run_all()
+
+        self.assertEqual(events, ["warmup", "dependent"])
+
+    async def test_sync_concurrent_initializer_runs_off_loop_thread(self) -> None:
+        threads: list[int] = []
+        auto_initializer.register("sync", lambda: threads.append(threading.get_ident()), concurrent=True)
+
+        await auto_initializer.run_all()
+
+        self.assertEqual(len(threads), 1)
+        self.assertNotEqual(threads[0], threading.get_ident())
+
+    async def test_failure_does_not_stop_other_initializers(self) -> None:
+        ran: list[str] = []
+
+        def broken() -> None:
+            raise RuntimeError("boom")
+
+        auto_initializer.register("broken", broken, concurrent=True)
+        auto_initializer.register("ok", lambda: ran.append("ok"), concurrent=True)
+
+        await auto_initializer.run_all()
+
+        self.assertEqual(ran, ["ok"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import json
+import sys
+import unittest
+from collections import OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+
+SERVER_ROOT = Path(__file__).resolve().parents[1]
+if str(SERVER_ROOT) not in sys.path:
+    sys.path.insert(0, str(SERVER_ROOT))
+
+from bson import ObjectId
+
+from app.utils.serialize_mongo_doc import serialize_doc, serialize_doc_fast
+
+
+def _user_doc() -> dict:
+    oid = ObjectId("65a0c0ffee00000000000001")
+    return {
+        "_id": oid,
+        "name": "asha",
+        "age": 31,
+        "verified": True,
+        "avatar": None,
+        "created_at": datetime(2026, 1, 1, 8, 30, 15, 250000),
+        "last_login": datetime(2026, 1, 2, tzinfo=timezone.utc),
+        "token": b"abc",
+        "settings": OrderedDict(theme="dark", owner=oid),
+        "devices": [{"id": oid, "seen": datetime(2025, 12, 31)}],
+    }
+
+
+class SerializeDocTests(unittest.TestCase):
+    def test_converts_nested_mongo_types(self) -> None:
+        doc = serialize_doc(_user_doc())
+
+        self.assertEqual(doc["_id"], "65a0c0ffee00000000000001")
+        self.assertEqual(doc["created_at"], "2026-01-01T08:30:15.250000")
+        self.assertEqual(doc["token"], "abc")
+        self.assertEqual(doc["settings"], {"theme": "dark", "owner": "65a0c0ffee00000000000001"})
+        self.assertEqual(doc["devices"][0]["seen"], "2025-12-31T00:00:00")
+
+    def test_fast_path_matches_dict_serializer(self) -> None:
+        for doc in (_user_doc(), [_user_doc(), _user_doc()]):
+            self.assertEqual(json.loads(serialize_doc_fast(doc)), serialize_doc(doc))
+
+
+if __name__ == "__main__":
+    unittest.main()
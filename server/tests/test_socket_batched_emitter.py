@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+SERVER_ROOT = Path(__file__).resolve().parents[1]
+if str(SERVER_ROOT) not in sys.path:
+    sys.path.insert(0, str(SERVER_ROOT))
+
+
+class BatchedEmitterTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        import app.kernel  # noqa: F401  (resolves the socket/kernel import cycle)
+        import app.socket.utils as socket_utils
+
+        self.socket_utils = socket_utils
+        self.emit = mock.AsyncMock()
+        patcher = mock.patch.object(socket_utils.sio, "emit", self.emit)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.emitter = socket_utils.BatchedEmitter(interval=0.001)
+        self.emitter.start()
+
+    async def asyncTearDown(self) -> None:
+        await self.emitter.stop()
+
+    async def _settle(self) -> None:
+        await asyncio.sleep(0.02)
+
+    async def test_burst_to_one_room_is_sent_as_one_batch_frame(self) -> None:
+        for step in range(3):
+            await self.emitter.emit("user:u1", "research-progress", {"step": step})
+        await self._settle()
+
+        self.emit.assert_awaited_once_with(
+            self.socket_utils.BATCH_EVENT,
+            [["research-progress", {"step": step}] for step in range(3)],
+            room="user:u1",
+        )
+
+    async def test_single_event_stays_a_plain_emit(self) -> None:
+        await self.emitter.emit("user:u1", "notification", {"message": "hi"})
+        await self._settle()
+
+        self.emit.assert_awaited_once_with("notification", {"message": "hi"}, room="user:u1")
+
+    async def test_rooms_are_batched_independently(self) -> None:
+        await self.emitter.emit("user:u1", "a", 1)
+        await self.emitter.emit("user:u2", "b", 2)
+        await self.emitter.emit("user:u1", "c", 3)
+        await self._settle()
+
+        calls = {call.kwargs["room"]: call.args for call in self.emit.await_args_list}
+        self.assertEqual(calls["user:u1"], (self.socket_utils.BATCH_EVENT, [["a", 1], ["c", 3]]))
+        self.assertEqual(calls["user:u2"], ("b", 2))
+
+    async def test_flush_sends_queued_events_before_returning(self) -> None:
+        await self.emitter.emit("user:u1", "spark:log", {"n": 1})
+        await asyncio.sleep(0)  # let the drain loop pick the event up and start its wait
+
+        await self.emitter.flush()
+        self.emit.assert_awaited_once_with("spark:log", {"n": 1}, room="user:u1")
+
+        await self._settle()
+        self.emit.assert_awaited_once()
+
+    async def test_emit_nowait_drops_when_queue_is_full(self) -> None:
+        await self.emitter.stop()
+        emitter = self.socket_utils.BatchedEmitter(interval=0.001)
+        with mock.patch.object(self.socket_utils, "EMIT_QUEUE_MAXSIZE", 1):
+            emitter.start()
+        try:
+            # Drain loop has not run yet, so the second event finds the queue full
+            self.assertTrue(emitter.emit_nowait("user:u1", "a", 1))
+            self.assertFalse(emitter.emit_nowait("user:u1", "b", 2))
+        finally:
+            await emitter.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
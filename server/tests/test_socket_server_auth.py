@@ -18,6 +18,7 @@ class SocketServerAuthTests(unittest.IsolatedAsyncioTestCase):
 
         self.socket_server = importlib.reload(socket_server)
         self.socket_server.connected_users.clear()
+        self.socket_server.sid_to_user.clear()
 
     async def test_daemon_auth_accepts_service_token(self) -> None:
         with mock.patch.dict(os.environ, {"DAEMON_SERVICE_TOKEN": "daemon-token"}, clear=False):
@@ -51,7 +52,9 @@ class SocketServerAuthTests(unittest.IsolatedAsyncioTestCase):
 
     async def test_user_jwt_auth_still_works(self) -> None:
         save_session = mock.AsyncMock()
-        with mock.patch.object(self.socket_server.sio, "save_session", save_session):
+        enter_room = mock.AsyncMock()
+        with mock.patch.object(self.socket_server.sio, "save_session", save_session), \
+                mock.patch.object(self.socket_server.sio, "enter_room", enter_room):
             with mock.patch.object(
                 self.socket_server.jwt,
                 "decode_token",
@@ -73,6 +76,19 @@ class SocketServerAuthTests(unittest.IsolatedAsyncioTestCase):
             },
         )
         self.assertEqual(self.socket_server.connected_users["user-123"], {"sid-user"})
+        self.assertEqual(self.socket_server.sid_to_user, {"sid-user": "user-123"})
+        enter_room.assert_awaited_once_with("sid-user", "user:user-123")
+
+    async def test_disconnect_clears_reverse_sid_index(self) -> None:
+        self.socket_server.connected_users["user-123"] = {"sid-a", "sid-b"}
+        self.socket_server.sid_to_user.update({"sid-a": "user-123", "sid-b": "user-123"})
+
+        get_session = mock.AsyncMock(return_value={"user_id": "user-123", "client_type": "user"})
+        with mock.patch.object(self.socket_server.sio, "get_session", get_session):
+            await self.socket_server.disconnect("sid-a")
+
+        self.assertEqual(self.socket_server.connected_users["user-123"], {"sid-b"})
+        self.assertEqual(self.socket_server.sid_to_user, {"sid-b": "user-123"})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+SERVER_ROOT = Path(__file__).resolve().parents[1]
+if str(SERVER_ROOT) not in sys.path:
+    sys.path.insert(0, str(SERVER_ROOT))
+
+import app.kernel  # noqa: F401  (resolves the socket/kernel import cycle)
+from app.kernel.execution.execution_models import Task, TaskRecord
+from app.socket.task_handler import TASK_DEBOUNCE_MAX, SocketTaskHandler
+
+
+def _task(task_id: str):
+    task = MagicMock()
+    task.task_id = task_id
+    return task
+
+
+class SocketTaskQueueTests(unittest.IsolatedAsyncioTestCase):
+    def _handler(self):
+        handler = SocketTaskHandler(MagicMock(), {"user-1": {"sid-1"}})
+        handler.emit_task_batch = AsyncMock(return_value=True)
+        return handler
+
+    async def test_nearby_pushes_coalesce_into_one_batch(self):
+        handler = self._handler()
+
+        for i in range(3):
+            self.assertTrue(await handler.push_task("user-1", _task(f"t{i}")))
+        await handler._task_consumers["user-1"]
+
+        handler.emit_task_batch.assert_awaited_once()
+        _, batch = handler.emit_task_batch.await_args.args
+        self.assertEqual([t.task_id for t in batch], ["t0", "t1", "t2"])
+        self.assertNotIn("user-1", handler._task_queues)
+
+    async def test_batch_is_capped_at_debounce_max(self):
+        handler = self._handler()
+
+        for i in range(TASK_DEBOUNCE_MAX + 1):
+            await handler.push_task("user-1", _task(f"t{i}"))
+        await handler._task_consumers["user-1"]
+
+        sizes = [len(call.args[1]) for call in handler.emit_task_batch.await_args_list]
+        self.assertEqual(sizes, [TASK_DEBOUNCE_MAX, 1])
+
+    async def test_offline_user_is_not_queued(self):
+        handler = self._handler()
+
+        self.assertFalse(await handler.push_task("user-2", _task("t0")))
+        self.assertEqual(handler._task_queues, {})
+
+
+class SocketTaskEncodingTests(unittest.TestCase):
+    def _handler(self, completed):
+        handler = SocketTaskHandler(MagicMock(), {"user-1": {"sid-1"}})
+        handler._completed_task_ids = MagicMock(return_value=completed)
+        return handler
+
+    def _record(self, task_id, depends_on=()):
+        return TaskRecord(task=Task(
+            task_id=task_id, tool="open_app", execution_target="client", depends_on=list(depends_on),
+        ))
+
+    def test_completed_column_omitted_when_empty(self):
+        handler = self._handler(set())
+
+        columns = json.loads(handler._encode_tasks("user-1", [self._record("t1"), self._record("t2", ["t1"])]))
+
+        self.assertNotIn("server_completed_dependencies", columns)
+        self.assertEqual(len(columns["task"]), 2)
+
+    def test_completed_column_sent_when_any_dependency_is_done(self):
+        handler = self._handler({"t0"})
+
+        columns = json.loads(handler._encode_tasks("user-1", [self._record("t1"), self._record("t2", ["t0"])]))
+
+        self.assertEqual(columns["server_completed_dependencies"], [[], ["t0"]])
+
+
+class SocketTaskResultsTests(unittest.IsolatedAsyncioTestCase):
+    def _handler(self):
+        handler = SocketTaskHandler(MagicMock(), {"user-1": {"sid-1"}})
+        handler.orchestrator = MagicMock()
+        handler.orchestrator.handle_client_ack_bulk = AsyncMock()
+        handler.orchestrator.mark_task_failed = AsyncMock()
+        return handler
+
+    async def test_bulk_ack_failure_fails_every_task_in_batch(self):
+        handler = self._handler()
+        handler.orchestrator.handle_client_ack_bulk.side_effect = RuntimeError("boom")
+
+        await handler.handle_task_results("user-1", [
+            {"task_id": "t1", "result": {"success": True, "data": {}}},
+            {"task_id": "t2", "result": {"success": "not-a-bool", "data": []}},
+        ])
+
+        failed = {call.args[1] for call in handler.orchestrator.mark_task_failed.await_args_list}
+        self.assertEqual(failed, {"t1", "t2"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -316,6 +316,8 @@ class ToolInstanceRegistry:
 
 
 _tool_instance_registry = ToolInstanceRegistry()
+# Bound once: the registry mutates this dict in place, never replaces it
+_tool_instances = _tool_instance_registry.tool_instances
 
 
 def get_tool_instance_registry() -> ToolInstanceRegistry:
@@ -323,4 +325,5 @@ def get_tool_instance_registry() -> ToolInstanceRegistry:
 
 
 def get_tool_instance(tool_name: str) -> Optional[BaseTool]:
-    return _tool_instance_registry.get(tool_name)
+    """Execution hot path — a single dict lookup."""
+    return _tool_instances.get(tool_name)